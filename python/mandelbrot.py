@@ -12,14 +12,18 @@ M1 Mac (Apple Silicon) 対応
 - 'q' キー: 終了
 """
 
+import copy
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Tuple, List, Optional
+from typing import Dict, Tuple, List, Optional
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
-from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import LinearSegmentedColormap, Normalize
 from matplotlib.image import AxesImage
 from matplotlib.text import Text
 
@@ -33,6 +37,17 @@ ZOOM_FACTOR_SCROLL_UP = 0.8  # ズームアウト
 ZOOM_FACTOR_SCROLL_DOWN = 1.25  # ズームイン
 ZOOM_FACTOR_RIGHT_CLICK = 0.8  # 右クリック時のズーム率（縮小範囲＝拡大）
 
+COMPACT_THRESHOLD = 0.2  # 未発散ピクセルがこの割合を下回ったら配列を詰めて計算
+TILE_H, TILE_W = 64, 256  # 計算タイルのサイズ (作業配列がL2キャッシュに収まる大きさ)
+FLOAT32_MAX_ZOOM = 1e2  # float32 で計算するズームレベルの上限 (これより深いと float64)
+
+RESULT_POLL_INTERVAL_MS = 20  # バックグラウンド計算の完了を確認する間隔 (ミリ秒)
+UPDATE_DEBOUNCE_MS = 50  # 操作が途切れてから再計算を始めるまでの待ち時間 (ミリ秒)
+
+# プレビュー (本計算の前に表示する粗い画像)
+PREVIEW_SCALE = 2  # 解像度を 1/PREVIEW_SCALE にする
+PREVIEW_MIN_ITER = 32  # プレビューの最大反復回数の下限 (通常は max_iter の 1/8)
+
 # macOS用の日本語フォント設定
 mpl.rcParams['font.family'] = [
     'Hiragino Sans', 'Hiragino Maru Gothic Pro', 'sans-serif'
@@ -100,33 +115,246 @@ class ViewPort:
         self.ymax = cy + new_height / 2
 
 
+def pixel_shift(
+    prev: ViewPort,
+    cur: ViewPort,
+    width: int,
+    height: int
+) -> Optional[Tuple[int, int]]:
+    """
+    prev から cur への移動が整数ピクセルの平行移動であればその量を返す
+    :return: (dx, dy) ピクセル。ズームを伴う場合や画像外への移動の場合は None
+    """
+    if width < 2 or height < 2:
+        return None
+    if not (np.isclose(cur.width, prev.width, rtol=1e-9, atol=0.0)
+            and np.isclose(cur.height, prev.height, rtol=1e-9, atol=0.0)):
+        return None
+
+    step_x = prev.width / (width - 1)
+    step_y = prev.height / (height - 1)
+    fx = (cur.xmin - prev.xmin) / step_x
+    fy = (cur.ymin - prev.ymin) / step_y
+    dx, dy = round(fx), round(fy)
+    if abs(fx - dx) > 1e-6 or abs(fy - dy) > 1e-6:
+        return None
+    if abs(dx) >= width or abs(dy) >= height:
+        return None
+    return dx, dy
+
+
+def make_scratch(dtype: type) -> Dict[str, np.ndarray]:
+    """
+    タイル計算用の作業配列を確保する
+    タイル1枚分の大きさで確保し、全タイル・全フレームで使い回す
+    :param dtype: 座標の型 (np.float32 または np.float64)
+    """
+    size = TILE_H * TILE_W
+    scratch = {
+        name: np.empty(size, dtype=dtype)
+        for name in ('Zr', 'Zi', 'Zr2', 'Zi2', 'mag2', 'Zr_new', 'Zi_new')
+    }
+    scratch['mask'] = np.empty(size, dtype=bool)
+    return scratch
+
+
+def _escape_time_tile(
+    Cr: np.ndarray,
+    Ci: np.ndarray,
+    max_iter: int,
+    scratch: Dict[str, np.ndarray]
+) -> np.ndarray:
+    """
+    タイル1枚分の反復回数を計算する
+    :param Cr: 各ピクセルの実部 (2次元)
+    :param Ci: 各ピクセルの虚部 (2次元)
+    :param scratch: make_scratch で確保した作業配列
+    """
+    # 作業配列の先頭をタイルの形に切り出して使う (連続領域のビュー)
+    shape = Cr.shape
+    n = Cr.size
+    Zr, Zi, Zr2, Zi2, mag2, Zr_new, Zi_new, mask = (
+        scratch[name][:n].reshape(shape)
+        for name in ('Zr', 'Zi', 'Zr2', 'Zi2', 'mag2', 'Zr_new', 'Zi_new', 'mask')
+    )
+    # 複素数配列ではなく実部・虚部を別々の配列で保持する
+    Zr.fill(0)
+    Zi.fill(0)
+    M = np.zeros(shape, dtype=np.int32)
+
+    # 主カージオイドと周期2のバルブは発散しないので反復対象から外す
+    q = (Cr - 0.25) ** 2 + Ci * Ci
+    in_cardioid = q * (q + (Cr - 0.25)) <= 0.25 * Ci * Ci
+    in_bulb = (Cr + 1.0) ** 2 + Ci * Ci <= 0.0625
+    outside = ~(in_cardioid | in_bulb)
+    M[~outside] = max_iter
+
+    # 未発散ピクセルの平坦化インデックス (None の間は全体配列のまま計算)
+    idx = None
+
+    # ベクトル化された計算
+    # 全体配列の間は out= で作業配列に書き込み、ループ内で一時配列を作らない
+    for i in range(max_iter):
+        if idx is None:
+            np.multiply(Zr, Zr, out=Zr2)
+            np.multiply(Zi, Zi, out=Zi2)
+            # |Z| <= 2 の代わりに |Z|^2 <= 4 で判定 (sqrt を回避)
+            np.add(Zr2, Zi2, out=mag2)
+            np.less_equal(mag2, 4.0, out=mask)
+            mask &= outside
+            n_alive = np.count_nonzero(mask)
+            if n_alive == 0:
+                break
+
+            # Zi_new = 2*Zr*Zi + Ci, Zr_new = Zr2 - Zi2 + Cr
+            np.multiply(Zr, Zi, out=Zi_new)
+            np.add(Zi_new, Zi_new, out=Zi_new)
+            np.add(Zi_new, Ci, out=Zi_new)
+            np.subtract(Zr2, Zi2, out=Zr_new)
+            np.add(Zr_new, Cr, out=Zr_new)
+
+            # マスクされた部分（発散していない部分）のみ書き戻し、反復回数を1つ進める
+            np.copyto(Zr, Zr_new, where=mask)
+            np.copyto(Zi, Zi_new, where=mask)
+            np.add(M, mask, out=M, casting='unsafe')
+
+            # 大半が発散したら、以降は未発散ピクセルだけの配列で計算する
+            # (詰めた配列は作業配列とは別に確保する)
+            if n_alive < COMPACT_THRESHOLD * mask.size:
+                idx = np.flatnonzero(mask)
+                Zr = Zr.ravel()[idx]
+                Zi = Zi.ravel()[idx]
+                Cr = Cr.ravel()[idx]
+                Ci = Ci.ravel()[idx]
+        else:
+            Zr2 = Zr * Zr
+            Zi2 = Zi * Zi
+            alive = (Zr2 + Zi2) <= 4.0
+            if not alive.any():
+                break
+
+            # 発散したピクセルは配列から取り除く
+            idx = idx[alive]
+            M.flat[idx] = i + 1
+            Zi = (2 * Zr * Zi + Ci)[alive]
+            Zr = (Zr2 - Zi2 + Cr)[alive]
+            Cr = Cr[alive]
+            Ci = Ci[alive]
+
+    return M
+
+
 def mandelbrot_set_vectorized(
     viewport: ViewPort,
     width: int,
     height: int,
-    max_iter: int
-) -> np.ndarray:
+    max_iter: int,
+    use_float32: bool = True,
+    x: Optional[np.ndarray] = None,
+    y: Optional[np.ndarray] = None,
+    cancel: Optional[threading.Event] = None,
+    scratch: Optional[Dict[str, np.ndarray]] = None
+) -> Optional[np.ndarray]:
     """
     マンデルブロ集合をベクトル化して高速に計算する
+    作業配列がL2キャッシュに収まるよう、画像をタイルに分けて計算する
+    :param use_float32: True なら float32 で計算する (深いズームで精度が
+                        必要な場合は False にして float64 を使う)
+    :param x: 事前計算済みの実軸 (np.linspace(xmin, xmax, width))。省略時は生成する
+    :param y: 事前計算済みの虚軸 (np.linspace(ymin, ymax, height))。省略時は生成する
+    :param cancel: セットされたら計算を中断する (タイルごとに確認)
+    :param scratch: make_scratch で確保した作業配列 (型が一致する場合のみ使う)
+                    省略時は呼び出しごとに確保する
+    :return: 反復回数の配列。中断された場合は None
     """
-    x = np.linspace(viewport.xmin, viewport.xmax, width)
-    y = np.linspace(viewport.ymin, viewport.ymax, height)
-    X, Y = np.meshgrid(x, y)
-    C = X + 1j * Y
+    dtype = np.float32 if use_float32 else np.float64
+    if scratch is None or scratch['Zr'].dtype != dtype:
+        scratch = make_scratch(dtype)
+    if x is None:
+        x = np.linspace(viewport.xmin, viewport.xmax, width)
+    if y is None:
+        y = np.linspace(viewport.ymin, viewport.ymax, height)
+    x = x.astype(dtype, copy=False)
+    y = y.astype(dtype, copy=False)
+
+    # 実軸に対して対称な範囲なら下半分だけ計算し、上半分は反転コピーする
+    if height > 1 and abs(y[0] + y[-1]) <= 1e-14 * abs(y[-1] - y[0]):
+        half = (height + 1) // 2
+        lower = mandelbrot_set_vectorized(
+            viewport, width, half, max_iter, use_float32,
+            x=x, y=y[:half], cancel=cancel, scratch=scratch
+        )
+        if lower is None:
+            return None
+        M = np.empty((height, width), dtype=np.int32)
+        M[:half] = lower
+        M[half:] = lower[:height // 2][::-1]
+        return M
+
+    M = np.empty((height, width), dtype=np.int32)
+
+    for by in range(0, height, TILE_H):
+        for bx in range(0, width, TILE_W):
+            if cancel is not None and cancel.is_set():
+                return None
+            Cr, Ci = np.meshgrid(x[bx:bx + TILE_W], y[by:by + TILE_H])
+            M[by:by + TILE_H, bx:bx + TILE_W] = _escape_time_tile(
+                Cr, Ci, max_iter, scratch
+            )
 
-    Z = np.zeros_like(C)
-    M = np.zeros_like(C, dtype=float)
+    return M
 
-    # ベクトル化された計算
-    # 多少メモリを食うがPythonループより圧倒的に速い
-    for i in range(max_iter):
-        mask = np.abs(Z) <= 2
-        if not np.any(mask):
-            break
-        
-        # マスクされた部分（発散していない部分）のみ計算
-        Z[mask] = Z[mask] * Z[mask] + C[mask]
-        M[mask] = i + 1
+
+def mandelbrot_set_shifted(
+    prev_M: np.ndarray,
+    shift: Tuple[int, int],
+    viewport: ViewPort,
+    width: int,
+    height: int,
+    max_iter: int,
+    x: np.ndarray,
+    y: np.ndarray,
+    use_float32: bool = True,
+    cancel: Optional[threading.Event] = None,
+    scratch: Optional[Dict[str, np.ndarray]] = None
+) -> Optional[np.ndarray]:
+    """
+    平行移動した表示範囲のマンデルブロ集合を計算する
+    前フレームと重なる部分はコピーし、新しく見えるL字型の帯だけを計算する
+    :param prev_M: 前フレームの反復回数
+    :param shift: 前フレームからの移動量 (dx, dy) ピクセル (pixel_shift の結果)
+    :param x: 実軸 (np.linspace(xmin, xmax, width))
+    :param y: 虚軸 (np.linspace(ymin, ymax, height))
+    :param use_float32: True なら float32 で計算する (mandelbrot_set_vectorized と同じ)
+    :param scratch: make_scratch で確保した作業配列
+    :return: 反復回数の配列。中断された場合は None
+    """
+    dx, dy = shift
+    M = np.empty((height, width), dtype=np.int32)
+
+    # 重なる部分: 新しい (j, i) は前フレームの (j + dy, i + dx)
+    i0, i1 = max(0, -dx), min(width, width - dx)
+    j0, j1 = max(0, -dy), min(height, height - dy)
+    M[j0:j1, i0:i1] = prev_M[j0 + dy:j1 + dy, i0 + dx:i1 + dx]
+
+    # 上下の帯 (全幅) と、左右の帯 (重なる行のみ)
+    strips = [
+        (slice(0, j0), slice(0, width)),
+        (slice(j1, height), slice(0, width)),
+        (slice(j0, j1), slice(0, i0)),
+        (slice(j0, j1), slice(i1, width)),
+    ]
+    for rows, cols in strips:
+        xs, ys = x[cols], y[rows]
+        if len(xs) == 0 or len(ys) == 0:
+            continue
+        strip = mandelbrot_set_vectorized(
+            viewport, len(xs), len(ys), max_iter, use_float32,
+            x=xs, y=ys, cancel=cancel, scratch=scratch
+        )
+        if strip is None:
+            return None
+        M[rows, cols] = strip
 
     return M
 
@@ -156,18 +384,47 @@ class MandelbrotViewer:
         self.height = height
         self.max_iter = max_iter
         self.cmap = create_colormap()
+        # カラーマップの RGBA テーブル (毎フレームの補間を避けるため事前計算)
+        self._lut = self.cmap(np.linspace(0, 1, self.cmap.N), bytes=True)
 
         # 表示範囲管理
         self.viewport = ViewPort.default()
         
+        # 座標軸のキャッシュ (範囲が変わった軸だけ再計算する)
+        self._x_key: Optional[Tuple[int, float, float]] = None
+        self._y_key: Optional[Tuple[int, float, float]] = None
+        self._x_vec: Optional[np.ndarray] = None
+        self._y_vec: Optional[np.ndarray] = None
+
         # 画像保存カウンタ
         self.save_counter = 0
 
+        # バックグラウンド計算 (UIを止めないよう別スレッドで計算する)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._future: Optional[Future] = None
+        self._cancel_event: Optional[threading.Event] = None
+        self._pending_viewport: Optional[ViewPort] = None
+        # 計算スレッド専用の作業配列 (フレームごとの確保を避ける。座標の型ごとに持つ)
+        self._scratch = {
+            np.float32: make_scratch(np.float32),
+            np.float64: make_scratch(np.float64),
+        }
+
+        # 直前に表示したフレーム (パン時に重なる部分を再利用する)
+        self._M_prev: Optional[np.ndarray] = None
+        self._prev_viewport: Optional[ViewPort] = None
+
         # Matplotlib オブジェクト
         self.fig: Optional[plt.Figure] = None
         self.ax: Optional[plt.Axes] = None
         self.im: Optional[AxesImage] = None
         self.status_text: Optional[Text] = None
+        self._poll_timer = None
+        self._pending_timer = None
+        # 画像とステータス以外を描画済みの背景 (部分描画で使う)
+        self._bg = None
+        # 保存用の描画中か (savefig も draw_event を発生させるため、その間は背景を取り直さない)
+        self._saving = False
 
         self._setup_plot()
         self._update_image()
@@ -179,13 +436,13 @@ class MandelbrotViewer:
         if self.fig.canvas.manager:
             self.fig.canvas.manager.set_window_title('マンデルブロ集合ビューア')
 
-        # 初期画像（ダミー）
+        # 初期画像（ダミー）: 色付けは自前の LUT で行うので RGBA で渡す
         self.im = self.ax.imshow(
-            np.zeros((self.height, self.width)),
+            np.zeros((self.height, self.width, 4), dtype=np.uint8),
             extent=self.viewport.extent,
-            cmap=self.cmap,
             origin='lower',
-            aspect='equal'
+            aspect='equal',
+            animated=True
         )
 
         self.ax.set_title('マンデルブロ集合 (Mandelbrot Set)', fontsize=16)
@@ -193,14 +450,18 @@ class MandelbrotViewer:
         self.ax.set_ylabel('Im(c) - 虚部', fontsize=12)
 
         # カラーバー
-        cbar = plt.colorbar(self.im, ax=self.ax, shrink=0.8)
+        cbar = plt.colorbar(
+            ScalarMappable(norm=Normalize(0, self.max_iter), cmap=self.cmap),
+            ax=self.ax, shrink=0.8
+        )
         cbar.set_label('反復回数', fontsize=12)
 
         # ステータステキスト
         self.status_text = self.fig.text(
             0.02, 0.02, '', fontsize=10,
             transform=self.fig.transFigure,
-            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8)
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
+            animated=True
         )
 
         # 操作説明
@@ -227,38 +488,202 @@ class MandelbrotViewer:
         self.fig.canvas.mpl_connect('scroll_event', self._on_scroll)
         self.fig.canvas.mpl_connect('button_press_event', self._on_press)
         self.fig.canvas.mpl_connect('key_press_event', self._on_key)
+        self.fig.canvas.mpl_connect('close_event', self._on_close)
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        self.fig.canvas.mpl_connect('resize_event', self._on_resize)
+
+        # 計算結果の確認用タイマー (Matplotlib の操作はメインスレッドで行う)
+        self._poll_timer = self.fig.canvas.new_timer(interval=RESULT_POLL_INTERVAL_MS)
+        self._poll_timer.add_callback(self._poll_result)
+
+        # 連続したホイール操作などをまとめ、最後の表示範囲だけを計算するためのタイマー
+        self._pending_timer = self.fig.canvas.new_timer(interval=UPDATE_DEBOUNCE_MS)
+        self._pending_timer.single_shot = True
+        self._pending_timer.add_callback(self._update_image)
 
         plt.tight_layout()
         plt.subplots_adjust(bottom=0.1)
 
     def _update_image(self):
-        """画像を更新"""
+        """画像の再計算を開始する (計算はバックグラウンドで行う)"""
+        # 予約済みの再計算はここで行うので取り消す
+        self._pending_timer.stop()
+
+        # 計算中の古いフレームは中断する
+        if self._cancel_event:
+            self._cancel_event.set()
+        if self._future:
+            self._future.cancel()
+
         if self.status_text:
             self.status_text.set_text('計算中...')
-            self.fig.canvas.draw_idle()
-            self.fig.canvas.flush_events()
+            self._blit()
+
+        # マンデルブロ集合の計算を投入
+        viewport = copy.copy(self.viewport)
+        x, y = self._get_axes()
+        self._cancel_event = threading.Event()
+        self._pending_viewport = viewport
+
+        # 純粋なパンなら前フレームと重なる部分を再利用する
+        shift = None
+        if self._M_prev is not None:
+            shift = pixel_shift(self._prev_viewport, viewport, self.width, self.height)
+
+        # 深いズームでは float32 の精度が足りないため float64 で計算する
+        use_float32 = self._use_float32(viewport)
+        scratch = self._scratch[np.float32 if use_float32 else np.float64]
+
+        # 全体を計算し直す場合は、先に粗いプレビューを表示する
+        if shift is None:
+            self._show_preview(viewport, use_float32)
+
+        if shift is not None:
+            self._future = self._executor.submit(
+                mandelbrot_set_shifted,
+                self._M_prev, shift, viewport,
+                self.width, self.height, self.max_iter,
+                x, y, use_float32, cancel=self._cancel_event, scratch=scratch
+            )
+        else:
+            self._future = self._executor.submit(
+                mandelbrot_set_vectorized,
+                viewport,
+                self.width, self.height, self.max_iter, use_float32,
+                x=x, y=y, cancel=self._cancel_event, scratch=scratch
+            )
+        self._poll_timer.start()
+
+    @staticmethod
+    def _use_float32(viewport: ViewPort) -> bool:
+        """表示範囲を float32 で計算できるか (ズームが FLOAT32_MAX_ZOOM 以下か) を返す"""
+        return 3.5 / viewport.width <= FLOAT32_MAX_ZOOM
+
+    def _schedule_update(self):
+        """
+        再計算を予約する
+        UPDATE_DEBOUNCE_MS 以内に次の操作があれば予約し直し、最後の操作だけを計算する
+        """
+        self._pending_timer.stop()
+        self._pending_timer.start()
+
+    def _poll_result(self):
+        """バックグラウンド計算が終わっていれば結果を表示する"""
+        if self._future is None:
+            self._poll_timer.stop()
+            return
+        if not self._future.done():
+            return
 
-        # マンデルブロ集合を計算
+        future, self._future = self._future, None
+        self._poll_timer.stop()
+        if future.cancelled():
+            return
+
+        M = future.result()
+        if M is not None:
+            self._show_result(M, self._pending_viewport)
+
+    def _colorize(self, M: np.ndarray, max_iter: int) -> np.ndarray:
+        """反復回数を LUT で RGBA 画像に変換する"""
+        n = len(self._lut)
+        idx = np.minimum(M * (n / max_iter), n - 1).astype(np.intp)
+        return self._lut[idx]
+
+    def _show_preview(self, viewport: ViewPort, use_float32: bool):
+        """低解像度・少ない反復回数で計算したプレビューを表示する"""
+        preview_iter = min(max(PREVIEW_MIN_ITER, self.max_iter // 8), self.max_iter)
         M = mandelbrot_set_vectorized(
-            self.viewport,
-            self.width, self.height, self.max_iter
+            viewport,
+            max(1, self.width // PREVIEW_SCALE),
+            max(1, self.height // PREVIEW_SCALE),
+            preview_iter,
+            use_float32
         )
 
-        # 画像を更新
-        self.im.set_data(M)
-        self.im.set_extent(self.viewport.extent)
-        self.im.set_clim(0, self.max_iter)
+        # 表示サイズへの拡大は imshow に任せる
+        self._set_image(self._colorize(M, preview_iter), viewport.extent)
+
+    def _show_result(self, M: np.ndarray, viewport: ViewPort):
+        """計算結果を表示する"""
+        self._M_prev = M
+        self._prev_viewport = viewport
 
         # ステータス更新
-        zoom_level = 3.5 / self.viewport.width
-        c = self.viewport.center
-        
+        zoom_level = 3.5 / viewport.width
+        c = viewport.center
+
         if self.status_text:
             self.status_text.set_text(
                 f'中心: ({c.real:.6f}, {c.imag:.6f}i) | ズーム: ×{zoom_level:.2f}'
             )
 
-        self.fig.canvas.draw_idle()
+        # 画像を更新
+        self._set_image(self._colorize(M, self.max_iter), viewport.extent)
+
+    def _set_image(self, rgba: np.ndarray, extent: List[float]):
+        """
+        画像を差し替えて描画する
+        範囲が変わらなければ背景を再利用して画像とステータスだけ描き直す
+        """
+        self.im.set_data(rgba)
+        if list(self.im.get_extent()) != list(extent):
+            # 軸の目盛りも変わるので全体を再描画する
+            self.im.set_extent(extent)
+            self.fig.canvas.draw_idle()
+        else:
+            self._blit()
+
+    def _draw_animated(self):
+        """背景に含めていない Artist (画像とステータス) を描画する"""
+        self.ax.draw_artist(self.im)
+        self.fig.draw_artist(self.status_text)
+
+    def _blit(self):
+        """保存済みの背景に画像とステータスだけを重ねて画面に反映する"""
+        canvas = self.fig.canvas
+        if self._bg is None or not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._bg)
+        self._draw_animated()
+        canvas.blit(self.fig.bbox)
+
+    def _on_draw(self, event):
+        """全体の再描画のたびに背景を保存し直す"""
+        if self._saving:
+            return
+        self._bg = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _on_resize(self, event):
+        """ウィンドウサイズが変わったら背景を破棄する (次の再描画で取り直す)"""
+        self._bg = None
+
+    def _get_axes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """座標軸ベクトルを取得する (範囲が変わった軸だけ再計算)"""
+        vp = self.viewport
+        x_key = (self.width, vp.xmin, vp.xmax)
+        if x_key != self._x_key:
+            self._x_vec = np.linspace(vp.xmin, vp.xmax, self.width)
+            self._x_key = x_key
+
+        y_key = (self.height, vp.ymin, vp.ymax)
+        if y_key != self._y_key:
+            self._y_vec = np.linspace(vp.ymin, vp.ymax, self.height)
+            self._y_key = y_key
+
+        return self._x_vec, self._y_vec
+
+    def _snap_to_pixel(self, x: float, y: float) -> Tuple[float, float]:
+        """現在の中心からの移動量が整数ピクセルになるよう座標を丸める"""
+        c = self.viewport.center
+        step_x = self.viewport.width / max(1, self.width - 1)
+        step_y = self.viewport.height / max(1, self.height - 1)
+        return (
+            c.real + round((x - c.real) / step_x) * step_x,
+            c.imag + round((y - c.imag) / step_y) * step_y,
+        )
 
     def _on_scroll(self, event):
         """マウスホイールによるズーム"""
@@ -282,7 +707,7 @@ class MandelbrotViewer:
         )
 
         self.viewport.zoom(factor, center=(event.xdata, event.ydata))
-        self._update_image()
+        self._schedule_update()
 
     def _on_press(self, event):
         """マウスボタン押下"""
@@ -290,13 +715,14 @@ class MandelbrotViewer:
             return
 
         if event.button == 1:  # 左クリック: パン
-            self.viewport.pan(event.xdata, event.ydata)
-            self._update_image()
+            # 移動量をピクセル単位に揃え、前フレームを再利用できるようにする
+            self.viewport.pan(*self._snap_to_pixel(event.xdata, event.ydata))
+            self._schedule_update()
 
         elif event.button == 3:  # 右クリック: ズームイン
             # 右クリックでズームイン（範囲を狭める）
             self.viewport.zoom(ZOOM_FACTOR_RIGHT_CLICK, center=(event.xdata, event.ydata))
-            self._update_image()
+            self._schedule_update()
 
     def _on_key(self, event):
         """キー入力"""
@@ -306,11 +732,28 @@ class MandelbrotViewer:
         elif event.key == 's':  # 保存
             self.save_counter += 1
             filename = f'mandelbrot_{self.save_counter:03d}.png'
-            self.fig.savefig(filename, dpi=150, bbox_inches='tight')
+            # 部分描画用に animated にした Artist も保存画像には含める
+            artists = (self.im, self.status_text)
+            for artist in artists:
+                artist.set_animated(False)
+            self._saving = True
+            try:
+                self.fig.savefig(filename, dpi=150, bbox_inches='tight')
+            finally:
+                self._saving = False
+                for artist in artists:
+                    artist.set_animated(True)
             print(f"画像を保存しました: {filename}")
         elif event.key == 'q':  # 終了
             plt.close(self.fig)
 
+    def _on_close(self, event):
+        """ウィンドウを閉じたらバックグラウンド計算を止める"""
+        self._pending_timer.stop()
+        if self._cancel_event:
+            self._cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
     def show(self):
         """ビューアを表示"""
         plt.show()
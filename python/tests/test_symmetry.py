@@ -0,0 +1,69 @@
+"""実軸に対して対称な表示範囲で、下半分を反転コピーした結果のテスト"""
+
+import importlib.util
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+_MODULE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'mandelbrot.py'
+)
+
+
+def _load_module():
+    """python/mandelbrot.py を読み込む (python_and_rust/ の同名モジュールと区別する)"""
+    spec = importlib.util.spec_from_file_location('mandelbrot_python', _MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+mb = _load_module()
+
+
+class MirrorTest(unittest.TestCase):
+    """反転コピーした結果が、全行を計算した結果と一致することを確認する"""
+
+    HEIGHTS = (1, 2, 3, 601)
+    WIDTH = 80
+    MAX_ITER = 128
+    VIEWPORTS = (
+        mb.ViewPort(-2.5, 1.0, -1.5, 1.5),
+        mb.ViewPort(-0.8, -0.7, -0.05, 0.05),
+    )
+
+    def _unmirrored(self, viewport, height, use_float32):
+        """1行ずつ計算する (高さ1では反転コピーは使われない)"""
+        y = np.linspace(viewport.ymin, viewport.ymax, height)
+        rows = [
+            mb.mandelbrot_set_vectorized(
+                viewport, self.WIDTH, 1, self.MAX_ITER, use_float32, y=y[j:j + 1]
+            )
+            for j in range(height)
+        ]
+        return np.vstack(rows)
+
+    def test_mirrored_matches_full_computation(self):
+        for viewport in self.VIEWPORTS:
+            for use_float32 in (True, False):
+                for height in self.HEIGHTS:
+                    with self.subTest(viewport=viewport, use_float32=use_float32, height=height):
+                        with mock.patch.object(
+                            mb, 'mandelbrot_set_vectorized', wraps=mb.mandelbrot_set_vectorized
+                        ) as spy:
+                            M = mb.mandelbrot_set_vectorized(
+                                viewport, self.WIDTH, height, self.MAX_ITER, use_float32
+                            )
+                        # 高さ2以上では下半分だけを計算する経路を通っていること
+                        if height > 1:
+                            half_heights = [c.args[2] for c in spy.call_args_list]
+                            self.assertIn((height + 1) // 2, half_heights)
+
+                        expected = self._unmirrored(viewport, height, use_float32)
+                        np.testing.assert_array_equal(M, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
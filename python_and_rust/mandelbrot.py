@@ -12,16 +12,27 @@ M1 Mac (Apple Silicon) 対応
 - 'q' キー: 終了
 """
 
-import copy
+import decimal
+import functools
+import io
+import math
+import os
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Tuple, Optional, Dict, Callable, TYPE_CHECKING
+from typing import Any, Tuple, List, Optional, Dict, Callable, TYPE_CHECKING
 
 import numpy as np
 import matplotlib.pyplot as plt
-from matplotlib.colors import LinearSegmentedColormap
-from matplotlib.backend_bases import MouseEvent, KeyEvent, MouseButton
+from PIL import Image
+from matplotlib.cm import ScalarMappable
+from matplotlib.colors import LinearSegmentedColormap, Normalize
+from matplotlib.backend_bases import (
+    CloseEvent, DrawEvent, KeyEvent, MouseButton, MouseEvent, ResizeEvent, TimerBase
+)
 from matplotlib.text import Text
+from matplotlib.transforms import Bbox
 import matplotlib as mpl
 
 if TYPE_CHECKING:
@@ -51,6 +62,20 @@ class ViewerConfig:
         SAVE_DPI: 保存DPI
         INITIAL_X_RANGE: 初期x軸範囲 (ズームレベル計算用)
         PROGRESS_BAR_WIDTH: プログレスバー文字幅
+        COMPACT_THRESHOLD: 未発散ピクセルの割合がこれを下回ったら
+            Pure Python版で配列を詰めて計算する
+        TILE_SIZE: Pure Python版の計算タイルサイズ (高さ, 幅)
+        PREVIEW_SCALE: 操作直後に表示するプレビューの縮小率 (縦横それぞれ 1/n)
+        SCROLL_DEBOUNCE_MS: ホイール操作が途切れてから計算を始めるまでの待ち時間 (ミリ秒)
+        RESULT_POLL_MS: 計算用スレッドの完了を確認する間隔 (ミリ秒)
+        ADAPTIVE_ITER_BASE: 初期表示での最大反復回数の割合
+        ADAPTIVE_ITER_PER_OCTAVE: ズームが2倍になるごとに増やす最大反復回数の割合
+        FLOAT32_MAX_ZOOM: float32 で計算するズームレベルの上限
+            (これより深いズームでは精度が足りないため float64 で計算する)
+        PERTURBATION_MIN_ZOOM: 摂動法で計算するズームレベルの下限
+            (これより深いズームでは中心の参照軌道からの差分で各ピクセルを計算する。
+            これより浅いズームでは float64 のままで十分正確で、摂動法は遅くなるだけなので、
+            float64 のピクセル間隔が保てなくなる付近に設定する)
         COLORMAP_COLORS: カラーマップ用RGB色リスト
     """
     # 初期表示範囲 (xmin, xmax, ymin, ymax)
@@ -75,6 +100,31 @@ class ViewerConfig:
     # プログレスバー
     PROGRESS_BAR_WIDTH: int = 30
 
+    # Pure Python版で配列を詰めて計算に切り替える未発散ピクセルの割合
+    COMPACT_THRESHOLD: float = 0.2
+
+    # Pure Python版の計算タイルサイズ (作業配列がL2キャッシュに収まる大きさ)
+    TILE_SIZE: Tuple[int, int] = (64, 256)
+
+    # プレビューの縮小率 (1/4 なら画素数は 1/16)
+    PREVIEW_SCALE: int = 4
+
+    # 連続したホイール操作をまとめる待ち時間 (ミリ秒)
+    SCROLL_DEBOUNCE_MS: int = 30
+
+    # 計算用スレッドの完了を確認する間隔 (ミリ秒)
+    RESULT_POLL_MS: int = 20
+
+    # ズームに応じた最大反復回数 (浅い表示では少なくし、深い表示ほど増やす)
+    ADAPTIVE_ITER_BASE: float = 0.25
+    ADAPTIVE_ITER_PER_OCTAVE: float = 0.15
+
+    # float32 で計算するズームレベルの上限
+    FLOAT32_MAX_ZOOM: float = 1e2
+
+    # 摂動法で計算するズームレベルの下限 (float64 の精度が足りなくなる付近)
+    PERTURBATION_MIN_ZOOM: float = 1e12
+
     # カラーマップ用の色定義 (RGB タプルのリスト)
     COLORMAP_COLORS: Tuple[Tuple[float, float, float], ...] = (
         (0.0, 0.0, 0.2),
@@ -193,8 +243,381 @@ try:
 except ImportError:
     _USE_RUST = False
 
+# Cython拡張の読み込みを試行 (Rust拡張をビルドできない環境向け)
+try:
+    import mandelbrot_cy
+    _USE_CYTHON = True
+except ImportError:
+    _USE_CYTHON = False
 
-def _mandelbrot_python(
+# Numba の読み込みを試行 (Rust拡張が無い場合の高速パス)
+try:
+    import numba
+    _USE_NUMBA = True
+except ImportError:
+    _USE_NUMBA = False
+
+# Numba版で Mariani–Silver 法 (境界が同じ値の矩形は内部を計算せずに塗る近似) を使うか
+# 結果が全ピクセルを計算するカーネルと一致しないことがあるため、既定では使わない
+_NUMBA_USE_MARIANI_SILVER = False
+
+# Numba版で guvectorize カーネルを使うか (False なら njit + prange 版)
+# (_NUMBA_USE_MARIANI_SILVER が False の場合のみ)
+_NUMBA_USE_GUVECTORIZE = True
+
+# Mariani–Silver 法: 並列に処理する矩形の大きさと、分割をやめて全ピクセルを計算する大きさ
+_MS_BLOCK_SIZE = 64
+_MS_MIN_SIZE = 16
+
+# 周期検出: この反復回数ごとに z を記録し、記録値に戻ったら発散しないとみなす
+_PERIODICITY_INTERVAL = 20
+_PERIODICITY_EPS = 1e-14
+
+
+if _USE_NUMBA:
+    @numba.njit(fastmath=True, cache=True, inline='always')
+    def _mandel_point(cr: float, ci: float, max_iter: int) -> int:
+        """1点のマンデルブロ計算 (Numba版)。
+
+        主カージオイドと周期2のバルブに含まれる点は反復せずに
+        max_iter を返す。また、軌道が周期的になった点も
+        その時点で max_iter を返す。
+
+        Args:
+            cr: 複素数の実部
+            ci: 複素数の虚部
+            max_iter: 最大反復回数
+
+        Returns:
+            発散するまでの反復回数
+        """
+        ci2 = ci * ci
+        q = (cr - 0.25) * (cr - 0.25) + ci2
+        if q * (q + (cr - 0.25)) <= 0.25 * ci2:
+            return max_iter
+        if (cr + 1.0) * (cr + 1.0) + ci2 <= 0.0625:
+            return max_iter
+
+        zr = 0.0
+        zi = 0.0
+        zr_old = 0.0
+        zi_old = 0.0
+        period = 0
+        n = 0
+        while n < max_iter:
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
+                break
+            zi = 2.0 * zr * zi + ci
+            zr = zr2 - zi2 + cr
+            n += 1
+
+            # 記録した z に戻っていれば周期軌道 (発散しない)
+            if abs(zr - zr_old) < _PERIODICITY_EPS and abs(zi - zi_old) < _PERIODICITY_EPS:
+                return max_iter
+            period += 1
+            if period == _PERIODICITY_INTERVAL:
+                period = 0
+                zr_old = zr
+                zi_old = zi
+        return n
+
+    @functools.lru_cache(maxsize=8)
+    def _make_kernel(max_iter: int) -> Callable[..., None]:
+        """max_iter を定数として埋め込んだ Numba JIT カーネルを生成する。
+
+        Numba はクロージャが参照する外側の変数をコンパイル時定数として扱うため、
+        反復ループの上限が定数畳み込みされる。画像サイズは埋め込まない
+        (パン時の帯やプレビューなど、サイズごとに再コンパイルが走るのを避けるため)。
+        型を明示しているので生成時にコンパイルされ、結果はディスクにキャッシュされる。
+        計算中は GIL を解放するので、ビューアの計算スレッドから呼んでも GUI は止まらない。
+
+        Args:
+            max_iter: 最大反復回数
+
+        Returns:
+            kernel(xmin, xmax, ymin, ymax, width, height, M) の形のカーネル。
+            行単位で並列化し、座標は np.linspace と同じ刻みで生成する。
+            M は反復回数の書き込み先 (height x width, int32)
+        """
+        @numba.njit(
+            'void(float64, float64, float64, float64, int64, int64, int32[:, ::1])',
+            parallel=True, fastmath=True, cache=True, nogil=True
+        )
+        def kernel(xmin, xmax, ymin, ymax, width, height, M):
+            dx = (xmax - xmin) / (width - 1) if width > 1 else 0.0
+            dy = (ymax - ymin) / (height - 1) if height > 1 else 0.0
+            for j in numba.prange(height):
+                ci = ymin + j * dy
+                for i in range(width):
+                    M[j, i] = _mandel_point(xmin + i * dx, ci, max_iter)
+
+        return kernel
+
+    @numba.guvectorize(
+        [(numba.float64[:], numba.float64, numba.int64, numba.int32[:])],
+        '(n),(),()->(n)',
+        target='parallel',
+        nopython=True,
+        fastmath=True,
+        cache=True
+    )
+    def _mandel_row(cr, ci, max_iter, out):
+        """guvectorize版のマンデルブロ計算カーネル (1行分)。
+
+        ci に長さ height の配列を渡すとブロードキャストにより
+        (height x n) の結果が行ごとに並列計算される。
+
+        Args:
+            cr: 行内の各ピクセルの実部 (n)
+            ci: 行の虚部
+            max_iter: 最大反復回数
+            out: 反復回数の書き込み先 (n)
+        """
+        for i in range(cr.shape[0]):
+            out[i] = _mandel_point(cr[i], ci, max_iter)
+
+
+if _USE_NUMBA:
+    @numba.njit(fastmath=True, cache=True, inline='always')
+    def _ms_pixel(cr, ci, max_iter, M, j, i):
+        """未計算 (負の値) のピクセルだけを計算し、その反復回数を返す。"""
+        if M[j, i] < 0:
+            M[j, i] = _mandel_point(cr[i], ci[j], max_iter)
+        return M[j, i]
+
+    @numba.njit(parallel=True, fastmath=True, cache=True, nogil=True)
+    def _mandelbrot_ms(cr, ci, max_iter, M):
+        """Mariani–Silver 法のマンデルブロ計算カーネル。
+
+        マンデルブロ集合は連結なので、矩形の境界がすべて同じ反復回数なら
+        内部も同じ値とみなし、反復せずに塗りつぶす。そうでなければ4分割して
+        同じ判定を繰り返し、_MS_MIN_SIZE 未満になったら全ピクセルを計算する。
+        画像は _MS_BLOCK_SIZE 四方の矩形に分け、矩形単位で並列化する。
+
+        近似であり、境界の画素の間をすり抜ける細い構造 (フィラメント) があると
+        内部を誤った値で塗ることがある。そのため結果は全ピクセルを計算する
+        カーネルと一致するとは限らない (最大反復回数が大きいほど差が出やすい)。
+
+        Args:
+            cr: 各列の実部 (width)
+            ci: 各行の虚部 (height)
+            max_iter: 最大反復回数
+            M: 反復回数の書き込み先 (height x width, int32)
+        """
+        height, width = M.shape
+        n_by = (height + _MS_BLOCK_SIZE - 1) // _MS_BLOCK_SIZE
+        n_bx = (width + _MS_BLOCK_SIZE - 1) // _MS_BLOCK_SIZE
+        for b in numba.prange(n_by * n_bx):
+            y0 = (b // n_bx) * _MS_BLOCK_SIZE
+            x0 = (b % n_bx) * _MS_BLOCK_SIZE
+            y1 = min(y0 + _MS_BLOCK_SIZE, height) - 1
+            x1 = min(x0 + _MS_BLOCK_SIZE, width) - 1
+            M[y0:y1 + 1, x0:x1 + 1] = -1
+
+            # 処理待ちの矩形 (上端, 下端, 左端, 右端。いずれも端を含む)
+            stack = np.empty((64, 4), dtype=np.int64)
+            stack[0, 0] = y0
+            stack[0, 1] = y1
+            stack[0, 2] = x0
+            stack[0, 3] = x1
+            sp = 1
+            while sp > 0:
+                sp -= 1
+                ry0 = stack[sp, 0]
+                ry1 = stack[sp, 1]
+                rx0 = stack[sp, 2]
+                rx1 = stack[sp, 3]
+
+                # 境界を計算し、すべて同じ値か調べる
+                v = _ms_pixel(cr, ci, max_iter, M, ry0, rx0)
+                uniform = True
+                for i in range(rx0, rx1 + 1):
+                    if _ms_pixel(cr, ci, max_iter, M, ry0, i) != v:
+                        uniform = False
+                    if _ms_pixel(cr, ci, max_iter, M, ry1, i) != v:
+                        uniform = False
+                for j in range(ry0 + 1, ry1):
+                    if _ms_pixel(cr, ci, max_iter, M, j, rx0) != v:
+                        uniform = False
+                    if _ms_pixel(cr, ci, max_iter, M, j, rx1) != v:
+                        uniform = False
+
+                if uniform:
+                    for j in range(ry0 + 1, ry1):
+                        for i in range(rx0 + 1, rx1):
+                            M[j, i] = v
+                elif ry1 - ry0 < _MS_MIN_SIZE or rx1 - rx0 < _MS_MIN_SIZE:
+                    for j in range(ry0 + 1, ry1):
+                        for i in range(rx0 + 1, rx1):
+                            _ms_pixel(cr, ci, max_iter, M, j, i)
+                else:
+                    # 中央の行・列を共有する4つの矩形に分割する
+                    ym = (ry0 + ry1) // 2
+                    xm = (rx0 + rx1) // 2
+                    for ya, yb, xa, xb in (
+                        (ry0, ym, rx0, xm), (ry0, ym, xm, rx1),
+                        (ym, ry1, rx0, xm), (ym, ry1, xm, rx1),
+                    ):
+                        stack[sp, 0] = ya
+                        stack[sp, 1] = yb
+                        stack[sp, 2] = xa
+                        stack[sp, 3] = xb
+                        sp += 1
+
+
+# GPU の利用を試行 (CUDA 環境では CuPy または Numba の CUDA ターゲット、
+# Apple Silicon では MLX の Metal バックエンド)
+try:
+    import cupy
+    if cupy.cuda.runtime.getDeviceCount() == 0:
+        raise ImportError("CUDA device not found")
+    _GPU_BACKEND: Optional[str] = 'cupy'
+except Exception:
+    try:
+        if not _USE_NUMBA:
+            raise ImportError("numba not found")
+        from numba import cuda
+        if not cuda.is_available():
+            raise ImportError("CUDA device not found")
+        _GPU_BACKEND = 'numba-cuda'
+    except Exception:
+        try:
+            import mlx.core as mx
+            _GPU_BACKEND = 'mlx'
+        except ImportError:
+            _GPU_BACKEND = None
+_USE_GPU = _GPU_BACKEND is not None
+
+
+if _GPU_BACKEND == 'cupy':
+    _mandel_cupy_kernel = cupy.ElementwiseKernel(
+        'float64 cr, float64 ci, int32 max_iter',
+        'int32 n',
+        '''
+        double ci2 = ci * ci;
+        double q = (cr - 0.25) * (cr - 0.25) + ci2;
+        if (q * (q + (cr - 0.25)) <= 0.25 * ci2
+                || (cr + 1.0) * (cr + 1.0) + ci2 <= 0.0625) {
+            n = max_iter;
+        } else {
+            double zr = 0.0, zi = 0.0;
+            int i;
+            for (i = 0; i < max_iter; i++) {
+                double zr2 = zr * zr, zi2 = zi * zi;
+                if (zr2 + zi2 > 4.0) break;
+                zi = 2.0 * zr * zi + ci;
+                zr = zr2 - zi2 + cr;
+            }
+            n = i;
+        }
+        ''',
+        'mandel'
+    )
+
+if _GPU_BACKEND == 'numba-cuda':
+    @cuda.jit('void(float64, float64, float64, float64, int32, int32[:, ::1])')
+    def _mandel_cuda(xmin, xmax, ymin, ymax, max_iter, out):
+        """Numba CUDA版のマンデルブロ計算カーネル (1スレッドが1ピクセルを担当)。
+
+        座標は np.linspace と同じ刻みで生成する。
+
+        Args:
+            xmin: x軸の最小値
+            xmax: x軸の最大値
+            ymin: y軸の最小値
+            ymax: y軸の最大値
+            max_iter: 最大反復回数
+            out: 反復回数の書き込み先 (height x width, デバイス配列)
+        """
+        i, j = cuda.grid(2)
+        height, width = out.shape
+        if i >= width or j >= height:
+            return
+        cr = xmin + i * ((xmax - xmin) / (width - 1)) if width > 1 else xmin
+        ci = ymin + j * ((ymax - ymin) / (height - 1)) if height > 1 else ymin
+
+        # 主カージオイドと周期2のバルブ内の点は反復しない
+        ci2 = ci * ci
+        q = (cr - 0.25) * (cr - 0.25) + ci2
+        if q * (q + (cr - 0.25)) <= 0.25 * ci2 or (cr + 1.0) * (cr + 1.0) + ci2 <= 0.0625:
+            out[j, i] = max_iter
+            return
+
+        zr = 0.0
+        zi = 0.0
+        n = 0
+        while n < max_iter:
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
+                break
+            zi = 2.0 * zr * zi + ci
+            zr = zr2 - zi2 + cr
+            n += 1
+        out[j, i] = n
+
+    @functools.lru_cache(maxsize=4)
+    def _cuda_device_buffer(height: int, width: int) -> Any:
+        """結果を書き込むデバイス配列を返す。
+
+        サイズごとに一度だけ確保し、以降のフレームでは使い回す
+        (フレームごとに転送するのは int32 の結果だけになる)。
+
+        Args:
+            height: 画像高さ (ピクセル)
+            width: 画像幅 (ピクセル)
+
+        Returns:
+            (height x width, int32) のデバイス配列
+        """
+        return cuda.device_array((height, width), dtype=np.int32)
+
+if _GPU_BACKEND == 'mlx':
+    # Metal は倍精度に対応していないため float で計算する
+    _mandel_mlx_kernel = mx.fast.metal_kernel(
+        name='mandel',
+        input_names=['cr', 'ci', 'max_iter'],
+        output_names=['out'],
+        source='''
+        uint i = thread_position_in_grid.x;
+        uint j = thread_position_in_grid.y;
+        uint width = cr_shape[0];
+        if (i >= width || j >= ci_shape[0]) {
+            return;
+        }
+        float cx = cr[i];
+        float cy = ci[j];
+        int limit = max_iter[0];
+
+        // 主カージオイドと周期2のバルブ内の点は反復しない
+        float cy2 = cy * cy;
+        float q = (cx - 0.25f) * (cx - 0.25f) + cy2;
+        if (q * (q + (cx - 0.25f)) <= 0.25f * cy2
+                || (cx + 1.0f) * (cx + 1.0f) + cy2 <= 0.0625f) {
+            out[j * width + i] = limit;
+            return;
+        }
+
+        float zr = 0.0f;
+        float zi = 0.0f;
+        int n = 0;
+        for (; n < limit; n++) {
+            float zr2 = zr * zr;
+            float zi2 = zi * zi;
+            if (zr2 + zi2 > 4.0f) {
+                break;
+            }
+            zi = 2.0f * zr * zi + cy;
+            zr = zr2 - zi2 + cx;
+        }
+        out[j * width + i] = n;
+        '''
+    )
+
+
+def _mandelbrot_gpu(
     xmin: float,
     xmax: float,
     ymin: float,
@@ -202,30 +625,258 @@ def _mandelbrot_python(
     width: int,
     height: int,
     max_iter: int,
-    show_progress: bool = True
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """GPU版マンデルブロ集合計算。
+
+    実軸・虚軸の1次元配列だけを転送し、2次元への展開はGPU上で行う
+    (Numba CUDA版は座標もGPU上で生成する)。
+
+    Args:
+        out: 結果の書き込み先 (height x width, int32, C連続)。
+            Numba CUDA版のみ使用し、デバイスからここへ直接コピーする
+
+    Returns:
+        反復回数を格納した2次元配列 (height x width, int32)
+    """
+    if _GPU_BACKEND == 'numba-cuda':
+        d_out = _cuda_device_buffer(height, width)
+        threads = (16, 16)
+        blocks = (math.ceil(width / threads[0]), math.ceil(height / threads[1]))
+        _mandel_cuda[blocks, threads](xmin, xmax, ymin, ymax, max_iter, d_out)
+        if out is None:
+            return d_out.copy_to_host()
+        d_out.copy_to_host(out)
+        return out
+
+    if _GPU_BACKEND == 'cupy':
+        cr = cupy.linspace(xmin, xmax, width)
+        ci = cupy.linspace(ymin, ymax, height)
+        n = _mandel_cupy_kernel(
+            cr[cupy.newaxis, :], ci[:, cupy.newaxis], np.int32(max_iter)
+        )
+        return cupy.asnumpy(n)
+
+    cr = mx.array(np.linspace(xmin, xmax, width, dtype=np.float32))
+    ci = mx.array(np.linspace(ymin, ymax, height, dtype=np.float32))
+    (out,) = _mandel_mlx_kernel(
+        inputs=[cr, ci, mx.array([max_iter], dtype=mx.int32)],
+        grid=(width, height, 1),
+        threadgroup=(16, 16, 1),
+        output_shapes=[(height, width)],
+        output_dtypes=[mx.int32],
+    )
+    return np.array(out)
+
+
+def _in_main_bulbs(cr: np.ndarray, ci: np.ndarray) -> np.ndarray:
+    """主カージオイドまたは周期2のバルブに含まれる点を判定する。
+
+    これらの点は発散しないため、反復計算を省略できる。
+
+    Args:
+        cr: 複素数の実部
+        ci: 複素数の虚部
+
+    Returns:
+        含まれる点が True のブール配列
+    """
+    ci2 = ci * ci
+    q = (cr - 0.25) ** 2 + ci2
+    in_cardioid = q * (q + (cr - 0.25)) <= 0.25 * ci2
+    in_bulb = (cr + 1.0) ** 2 + ci2 <= 0.0625
+    return in_cardioid | in_bulb
+
+
+def _make_scratch(dtype: type) -> Dict[str, np.ndarray]:
+    """タイル計算用の作業配列を確保する。
+
+    タイル1枚分の大きさで確保し、全タイルで使い回す。
+
+    Args:
+        dtype: 座標の型 (np.float32 または np.float64)
+
+    Returns:
+        作業配列の辞書 (各配列は平坦な1次元配列)
+    """
+    tile_h, tile_w = CONFIG.TILE_SIZE
+    size = tile_h * tile_w
+    scratch = {
+        name: np.empty(size, dtype=dtype)
+        for name in ('Zr', 'Zi', 'Zr2', 'Zi2', 'mag2', 'Zr_new', 'Zi_new')
+    }
+    scratch['mask'] = np.empty(size, dtype=bool)
+    return scratch
+
+
+# Pure Python版でタイル行を並列に計算するスレッドプール (初回使用時に生成して使い回す)
+# NumPy の ufunc は GIL を解放するため、スレッドでも複数コアを使える
+_python_pool: Optional[ThreadPoolExecutor] = None
+_scratch_local = threading.local()
+
+
+def _get_python_pool() -> ThreadPoolExecutor:
+    """Pure Python版で使うスレッドプールを取得する。
+
+    Returns:
+        プロセス内で共有するスレッドプール
+    """
+    global _python_pool
+    if _python_pool is None:
+        _python_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _python_pool
+
+
+def _get_scratch(dtype: type) -> Dict[str, np.ndarray]:
+    """呼び出したスレッド専用の作業配列を取得する (型が変わった時だけ確保し直す)。
+
+    Args:
+        dtype: 座標の型 (np.float32 または np.float64)
+
+    Returns:
+        _make_scratch で確保した作業配列
+    """
+    scratch = getattr(_scratch_local, 'scratch', None)
+    if scratch is None or scratch['Zr'].dtype != dtype:
+        scratch = _make_scratch(dtype)
+        _scratch_local.scratch = scratch
+    return scratch
+
+
+def _escape_time_tile(
+    Cr: np.ndarray,
+    Ci: np.ndarray,
+    max_iter: int,
+    scratch: Dict[str, np.ndarray]
 ) -> np.ndarray:
-    """Pure Python版マンデルブロ集合計算 (フォールバック用)。"""
-    # 複素平面上のグリッドを生成
-    x = np.linspace(xmin, xmax, width)
-    y = np.linspace(ymin, ymax, height)
-    X, Y = np.meshgrid(x, y)
-    C = X + 1j * Y
+    """タイル1枚分の反復回数を計算する (Pure Python版)。
+
+    全体配列の間は out= で作業配列に書き込み、ループ内で一時配列を作らない。
+    更新はマスクせずに全ピクセル計算し、書き戻しだけをマスクで行う。
 
-    Z = np.zeros_like(C)
-    M = np.zeros_like(C, dtype=float)
+    Args:
+        Cr: 各ピクセルの実部 (2次元)
+        Ci: 各ピクセルの虚部 (2次元)
+        max_iter: 最大反復回数
+        scratch: _make_scratch で確保した作業配列
+
+    Returns:
+        反復回数を格納した2次元配列 (Cr と同じ形状, int32)
+    """
+    # 作業配列の先頭をタイルの形に切り出して使う (連続領域のビュー)
+    shape = Cr.shape
+    n = Cr.size
+    Zr, Zi, Zr2, Zi2, mag2, Zr_new, Zi_new, mask = (
+        scratch[name][:n].reshape(shape)
+        for name in ('Zr', 'Zi', 'Zr2', 'Zi2', 'mag2', 'Zr_new', 'Zi_new', 'mask')
+    )
+    # 複素数配列ではなく実部・虚部を別々の配列で保持する
+    Zr.fill(0)
+    Zi.fill(0)
+    M = np.zeros(shape, dtype=np.int32)
 
-    # プログレスバー更新頻度: max_iter の1%ごと (最低1回)
-    update_interval = max(1, max_iter // 100)
+    # 主カージオイドと周期2のバルブは発散しないので反復対象から外す
+    outside = ~_in_main_bulbs(Cr, Ci)
+    M[~outside] = max_iter
+
+    # 未発散ピクセルの平坦化インデックス (None の間は全体配列のまま計算)
+    idx = None
 
     for i in range(max_iter):
-        mask = np.abs(Z) <= 2
-        Z[mask] = Z[mask] * Z[mask] + C[mask]
-        M[mask] = i + 1
+        if idx is None:
+            np.multiply(Zr, Zr, out=Zr2)
+            np.multiply(Zi, Zi, out=Zi2)
+            # |Z| <= 2 の代わりに |Z|^2 <= 4 で判定 (sqrt を回避)
+            np.add(Zr2, Zi2, out=mag2)
+            np.less_equal(mag2, 4.0, out=mask)
+            mask &= outside
+            n_alive = np.count_nonzero(mask)
+            if n_alive == 0:
+                # 全ピクセルが発散済みなら残りの反復は不要
+                break
+
+            # Zi_new = 2*Zr*Zi + Ci, Zr_new = Zr2 - Zi2 + Cr
+            np.multiply(Zr, Zi, out=Zi_new)
+            np.add(Zi_new, Zi_new, out=Zi_new)
+            np.add(Zi_new, Ci, out=Zi_new)
+            np.subtract(Zr2, Zi2, out=Zr_new)
+            np.add(Zr_new, Cr, out=Zr_new)
+
+            # 未発散ピクセルだけ書き戻し、反復回数を1つ進める
+            np.copyto(Zr, Zr_new, where=mask)
+            np.copyto(Zi, Zi_new, where=mask)
+            np.add(M, mask, out=M, casting='unsafe')
+
+            # 大半が発散したら、以降は未発散ピクセルだけの配列で計算する
+            # (詰めた配列は作業配列とは別に確保する)
+            if n_alive < CONFIG.COMPACT_THRESHOLD * mask.size:
+                idx = np.flatnonzero(mask)
+                Zr = Zr.ravel()[idx]
+                Zi = Zi.ravel()[idx]
+                Cr = Cr.ravel()[idx]
+                Ci = Ci.ravel()[idx]
+        else:
+            Zr2 = Zr * Zr
+            Zi2 = Zi * Zi
+            alive = (Zr2 + Zi2) <= 4.0
+            if not alive.any():
+                break
+
+            # 発散したピクセルは配列から取り除く
+            idx = idx[alive]
+            M.flat[idx] = i + 1
+            Zi = (2 * Zr * Zi + Ci)[alive]
+            Zr = (Zr2 - Zi2 + Cr)[alive]
+            Cr = Cr[alive]
+            Ci = Ci[alive]
+
+    return M
+
+
+def _mandelbrot_python(
+    xmin: float,
+    xmax: float,
+    ymin: float,
+    ymax: float,
+    width: int,
+    height: int,
+    max_iter: int,
+    show_progress: bool = True,
+    use_float32: bool = True,
+    x: Optional[np.ndarray] = None,
+    y: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Pure Python版マンデルブロ集合計算 (フォールバック用)。
+
+    作業配列がL2キャッシュに収まるよう、画像をタイルに分けて計算する。
+    """
+    dtype = np.float32 if use_float32 else np.float64
+    tile_h, tile_w = CONFIG.TILE_SIZE
+
+    # 複素平面上の座標軸 (事前計算済みでなければ生成)
+    if x is None:
+        x = np.linspace(xmin, xmax, width)
+    if y is None:
+        y = np.linspace(ymin, ymax, height)
+    x = x.astype(dtype, copy=False)
+    y = y.astype(dtype, copy=False)
+    M = out if out is not None else np.empty((height, width), dtype=np.int32)
+
+    def compute_tile_row(by: int) -> int:
+        scratch = _get_scratch(dtype)
+        for bx in range(0, width, tile_w):
+            Cr, Ci = np.meshgrid(x[bx:bx + tile_w], y[by:by + tile_h])
+            M[by:by + tile_h, bx:bx + tile_w] = _escape_time_tile(
+                Cr, Ci, max_iter, scratch
+            )
+        return by
 
-        # プログレスバー表示
-        if show_progress and (i % update_interval == 0 or i == max_iter - 1):
-            progress = (i + 1) / max_iter
-            print_progress_bar(progress)
+    # タイル行ごとにスレッドプールで並列計算する
+    for by in _get_python_pool().map(compute_tile_row, range(0, height, tile_h)):
+        # プログレスバー表示 (タイル行ごと、上から順に)
+        if show_progress:
+            print_progress_bar(min(by + tile_h, height) / height)
 
     if show_progress:
         print(" 完了!")
@@ -241,12 +892,16 @@ def mandelbrot_set_vectorized(
     width: int,
     height: int,
     max_iter: int,
-    show_progress: bool = True
+    show_progress: bool = True,
+    use_float32: bool = True,
+    x: Optional[np.ndarray] = None,
+    y: Optional[np.ndarray] = None,
+    out: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """マンデルブロ集合を計算する。
 
-    Rust拡張が利用可能な場合は高速なRust版を使用し、
-    そうでない場合はPure Python版にフォールバックする。
+    GPU (CuPy / Numba CUDA / MLX) > Rust拡張 > Cython拡張 > Numba 版の優先順で
+    利用可能なものを使用し、いずれも無い場合は Pure Python版にフォールバックする。
 
     Args:
         xmin: x軸の最小値
@@ -257,11 +912,32 @@ def mandelbrot_set_vectorized(
         height: 画像高さ (ピクセル)
         max_iter: 最大反復回数
         show_progress: プログレスバーを表示するか
+        use_float32: float32 で計算するか (深いズームで精度が必要な場合は
+            False にして float64 を使う。Pure Python版・MLX版以外は常に float64。
+            MLX版は float32 でしか計算できないため、False の場合は使わずに
+            CPU の計算カーネルで計算する)
+        x: 事前計算済みの実軸 (np.linspace(xmin, xmax, width))。
+            省略時は必要に応じて生成する
+        y: 事前計算済みの虚軸 (np.linspace(ymin, ymax, height))。
+            省略時は必要に応じて生成する
+        out: 結果の書き込み先 (height x width, int32, C連続)。
+            Numba版 (CUDA版を含む)・Pure Python版はここに直接書き込み、
+            フレームごとの確保を避ける。
+            他の版では使わない
 
     Returns:
-        反復回数を格納した2次元配列 (height x width)
+        反復回数を格納した2次元配列 (height x width)。
+        out を使った場合は out そのもの
     """
-    if _USE_RUST:
+    if _USE_GPU and (use_float32 or _GPU_BACKEND != 'mlx'):
+        if show_progress:
+            sys.stdout.write(f"🎮 GPU版 ({_GPU_BACKEND}) で計算中...")
+            sys.stdout.flush()
+        M = _mandelbrot_gpu(xmin, xmax, ymin, ymax, width, height, max_iter, out)
+        if show_progress:
+            print(" 完了!")
+        return M
+    elif _USE_RUST:
         if show_progress:
             sys.stdout.write("🚀 Rust版で計算中...")
             sys.stdout.flush()
@@ -271,20 +947,295 @@ def mandelbrot_set_vectorized(
         if show_progress:
             print(" 完了!")
         return result
+    elif _USE_CYTHON:
+        if show_progress:
+            sys.stdout.write("🐍 Cython版で計算中...")
+            sys.stdout.flush()
+        M = mandelbrot_cy.mandel(xmin, xmax, ymin, ymax, width, height, max_iter)
+        if show_progress:
+            print(" 完了!")
+        return M
+    elif _USE_NUMBA:
+        if show_progress:
+            sys.stdout.write("⚡ Numba版で計算中...")
+            sys.stdout.flush()
+        if _NUMBA_USE_MARIANI_SILVER:
+            cr = x if x is not None else np.linspace(xmin, xmax, width)
+            ci = y if y is not None else np.linspace(ymin, ymax, height)
+            M = out if out is not None else np.empty((height, width), dtype=np.int32)
+            _mandelbrot_ms(cr, ci, max_iter, M)
+        elif _NUMBA_USE_GUVECTORIZE:
+            cr = x if x is not None else np.linspace(xmin, xmax, width)
+            ci = y if y is not None else np.linspace(ymin, ymax, height)
+            if out is not None:
+                M = _mandel_row(cr, ci, max_iter, out=out)
+            else:
+                M = _mandel_row(cr, ci, max_iter)
+        else:
+            M = out if out is not None else np.empty((height, width), dtype=np.int32)
+            _make_kernel(max_iter)(xmin, xmax, ymin, ymax, width, height, M)
+        if show_progress:
+            print(" 完了!")
+        return M
     else:
         return _mandelbrot_python(
-            xmin, xmax, ymin, ymax, width, height, max_iter, show_progress
+            xmin, xmax, ymin, ymax, width, height, max_iter,
+            show_progress, use_float32, x, y, out
         )
 
 
 
+def mandelbrot_set_shifted(
+    prev_M: np.ndarray,
+    shift: Tuple[int, int],
+    x: np.ndarray,
+    y: np.ndarray,
+    max_iter: int,
+    out: Optional[np.ndarray] = None,
+    use_float32: bool = True
+) -> np.ndarray:
+    """平行移動した表示範囲のマンデルブロ集合を計算する。
+
+    前フレームと重なる部分はずらしてコピーし、新しく見えるL字型の帯だけを計算する。
+
+    Args:
+        prev_M: 前フレームの反復回数 (height x width)
+        shift: 前フレームからの移動量 (dx, dy) ピクセル (ViewBounds.pixel_shift の結果)
+        x: 移動後の実軸 (np.linspace(xmin, xmax, width))
+        y: 移動後の虚軸 (np.linspace(ymin, ymax, height))
+        max_iter: 最大反復回数
+        out: 結果の書き込み先 (height x width)。prev_M と同じ配列でもよい。
+            省略時は prev_M と同じ形・型で確保する
+        use_float32: float32 で計算するか (mandelbrot_set_vectorized と同じ)
+
+    Returns:
+        反復回数を格納した2次元配列 (out を渡した場合は out そのもの)
+    """
+    height, width = prev_M.shape
+    M = out if out is not None else np.empty_like(prev_M)
+    dx, dy = shift
+
+    # 重なる部分: 新しい (j, i) は前フレームの (j + dy, i + dx)
+    # (コピー元と先が同じ配列で重なっていても NumPy が正しく扱う)
+    i0, i1 = max(0, -dx), min(width, width - dx)
+    j0, j1 = max(0, -dy), min(height, height - dy)
+    M[j0:j1, i0:i1] = prev_M[j0 + dy:j1 + dy, i0 + dx:i1 + dx]
+
+    # 上下の帯 (全幅) と、左右の帯 (重なる行のみ)
+    strips = [
+        (slice(0, j0), slice(0, width)),
+        (slice(j1, height), slice(0, width)),
+        (slice(j0, j1), slice(0, i0)),
+        (slice(j0, j1), slice(i1, width)),
+    ]
+    for rows, cols in strips:
+        xs, ys = x[cols], y[rows]
+        if len(xs) == 0 or len(ys) == 0:
+            continue
+        M[rows, cols] = mandelbrot_set_vectorized(
+            xs[0], xs[-1], ys[0], ys[-1], len(xs), len(ys), max_iter,
+            show_progress=False, use_float32=use_float32, x=xs, y=ys
+        )
+
+    return M
+
+
+# 摂動法の参照軌道を計算する精度 (10進の桁数、約 128 ビット)
+_REFERENCE_ORBIT_DIGITS = 40
+
+
+def _reference_orbit(cr: float, ci: float, max_iter: int) -> Tuple[np.ndarray, np.ndarray]:
+    """摂動法で使う参照点の軌道を多倍長精度で計算する。
+
+    軌道の誤差は反復のたびに拡大するため、反復自体は decimal で行い、
+    各ステップの値だけを float64 に丸めて保存する。
+
+    Args:
+        cr: 参照点の実部
+        ci: 参照点の虚部
+        max_iter: 最大反復回数
+
+    Returns:
+        (実部, 虚部) の配列のタプル。Z[0] = 0 から、発散した点
+        (発散しなければ Z[max_iter]) までを含む
+    """
+    zr_list = [0.0]
+    zi_list = [0.0]
+    with decimal.localcontext() as ctx:
+        ctx.prec = _REFERENCE_ORBIT_DIGITS
+        cr_d = decimal.Decimal(cr)
+        ci_d = decimal.Decimal(ci)
+        zr = decimal.Decimal(0)
+        zi = decimal.Decimal(0)
+        four = decimal.Decimal(4)
+        for _ in range(max_iter):
+            zr, zi = zr * zr - zi * zi + cr_d, 2 * zr * zi + ci_d
+            zr_list.append(float(zr))
+            zi_list.append(float(zi))
+            if zr * zr + zi * zi > four:
+                break
+    return np.array(zr_list), np.array(zi_list)
+
+
+if _USE_NUMBA:
+    @numba.njit(parallel=True, fastmath=True, cache=True, nogil=True)
+    def _perturbation_kernel(zr_ref, zi_ref, dcr, dci, max_iter, M):
+        """摂動法のカーネル (Numba版)。
+
+        各ピクセルについて参照軌道 Z からの差分 dz を
+        dz <- (2Z + dz) dz + dc で更新する。|Z + dz| < |dz| となった場合や
+        参照軌道の終わりに達した場合は、z = Z + dz を新しい差分として
+        参照軌道の先頭からやり直す (rebase)。
+
+        Args:
+            zr_ref: 参照軌道の実部
+            zi_ref: 参照軌道の虚部
+            dcr: 各列の参照点からの実部の差 (width)
+            dci: 各行の参照点からの虚部の差 (height)
+            max_iter: 最大反復回数
+            M: 反復回数の書き込み先 (height x width, int32)
+        """
+        ref_len = zr_ref.shape[0] - 1
+        height, width = M.shape
+        for j in numba.prange(height):
+            for i in range(width):
+                dzr = 0.0
+                dzi = 0.0
+                m = 0
+                n = 0
+                while n < max_iter:
+                    tr = 2.0 * zr_ref[m] + dzr
+                    ti = 2.0 * zi_ref[m] + dzi
+                    dzr, dzi = tr * dzr - ti * dzi + dcr[i], tr * dzi + ti * dzr + dci[j]
+                    m += 1
+                    n += 1
+                    zr = zr_ref[m] + dzr
+                    zi = zi_ref[m] + dzi
+                    mag = zr * zr + zi * zi
+                    if mag > 4.0:
+                        break
+                    if mag < dzr * dzr + dzi * dzi or m == ref_len:
+                        dzr = zr
+                        dzi = zi
+                        m = 0
+                M[j, i] = n
+
+
+def _perturbation_python(
+    zr_ref: np.ndarray,
+    zi_ref: np.ndarray,
+    dcr: np.ndarray,
+    dci: np.ndarray,
+    max_iter: int,
+    M: np.ndarray
+) -> None:
+    """摂動法のカーネル (Pure Python版)。
+
+    _perturbation_kernel と同じ計算を未発散のピクセルをまとめて行う。
+
+    Args:
+        zr_ref: 参照軌道の実部
+        zi_ref: 参照軌道の虚部
+        dcr: 各列の参照点からの実部の差 (width)
+        dci: 各行の参照点からの虚部の差 (height)
+        max_iter: 最大反復回数
+        M: 反復回数の書き込み先 (height x width, int32, C連続)
+    """
+    Z = zr_ref + 1j * zi_ref
+    ref_len = len(Z) - 1
+    M.fill(max_iter)
+    M_flat = M.reshape(-1)
+
+    # 未発散のピクセルだけを1次元に詰めて持つ
+    idx = np.arange(M.size)
+    dc = (dcr[np.newaxis, :] + 1j * dci[:, np.newaxis]).reshape(-1)
+    dz = np.zeros_like(dc)
+    m = np.zeros(M.size, dtype=np.intp)
+    for n in range(1, max_iter + 1):
+        dz = (2.0 * Z[m] + dz) * dz + dc
+        m += 1
+        z = Z[m] + dz
+        mag = z.real * z.real + z.imag * z.imag
+
+        escaped = mag > 4.0
+        M_flat[idx[escaped]] = n
+
+        rebase = ~escaped & ((mag < dz.real * dz.real + dz.imag * dz.imag) | (m == ref_len))
+        dz[rebase] = z[rebase]
+        m[rebase] = 0
+
+        alive = ~escaped
+        idx, dc, dz, m = idx[alive], dc[alive], dz[alive], m[alive]
+        if idx.size == 0:
+            break
+
+
+def mandelbrot_set_perturbation(
+    xmin: float,
+    xmax: float,
+    ymin: float,
+    ymax: float,
+    width: int,
+    height: int,
+    max_iter: int,
+    show_progress: bool = True,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """摂動法でマンデルブロ集合を計算する (深いズーム用)。
+
+    画像中央のピクセルを参照点としてその軌道だけを多倍長精度で求め、
+    他のピクセルは参照点からの差分を float64 で反復する。
+    差分は小さな値のまま扱えるため、float64 でピクセル座標そのものが
+    区別できなくなるズームでも画像が潰れない。
+
+    Args:
+        xmin: x軸の最小値
+        xmax: x軸の最大値
+        ymin: y軸の最小値
+        ymax: y軸の最大値
+        width: 画像幅 (ピクセル)
+        height: 画像高さ (ピクセル)
+        max_iter: 最大反復回数
+        show_progress: 進捗を表示するか
+        out: 結果の書き込み先 (height x width, int32, C連続)。省略時は確保する
+
+    Returns:
+        反復回数を格納した2次元配列 (height x width)。
+        out を使った場合は out そのもの
+    """
+    if show_progress:
+        sys.stdout.write("🔬 摂動法で計算中...")
+        sys.stdout.flush()
+
+    M = out if out is not None else np.empty((height, width), dtype=np.int32)
+
+    # 座標は np.linspace と同じ刻み。参照点からの差は刻みの整数倍として直接求める
+    dx = (xmax - xmin) / (width - 1) if width > 1 else 0.0
+    dy = (ymax - ymin) / (height - 1) if height > 1 else 0.0
+    ref_i, ref_j = width // 2, height // 2
+    dcr = (np.arange(width) - ref_i) * dx
+    dci = (np.arange(height) - ref_j) * dy
+
+    zr_ref, zi_ref = _reference_orbit(xmin + ref_i * dx, ymin + ref_j * dy, max_iter)
+    if _USE_NUMBA:
+        _perturbation_kernel(zr_ref, zi_ref, dcr, dci, max_iter, M)
+    else:
+        _perturbation_python(zr_ref, zi_ref, dcr, dci, max_iter, M)
+
+    if show_progress:
+        print(" 完了!")
+    return M
+
+
 # =============================================================================
 # ViewBounds クラス
 # =============================================================================
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ViewBounds:
     """表示範囲を管理するデータクラス。
 
+    不変なので、同じインスタンスをコピーせずに共有してよい。
+
     Attributes:
         xmin: x軸の最小値
         xmax: x軸の最大値
@@ -369,6 +1320,63 @@ class ViewBounds:
         """
         return self.zoom_to(x_center, y_center, 1.0)
 
+    def snap_to_pixel(
+        self,
+        x: float,
+        y: float,
+        width: int,
+        height: int
+    ) -> Tuple[float, float]:
+        """現在の中心からの移動量が整数ピクセルになるよう座標を丸める。
+
+        Args:
+            x: x座標
+            y: y座標
+            width: 画像幅 (ピクセル)
+            height: 画像高さ (ピクセル)
+
+        Returns:
+            丸めた (x, y) 座標
+        """
+        center_x, center_y = self.center
+        step_x = self.x_range / max(1, width - 1)
+        step_y = self.y_range / max(1, height - 1)
+        return (
+            center_x + round((x - center_x) / step_x) * step_x,
+            center_y + round((y - center_y) / step_y) * step_y,
+        )
+
+    def pixel_shift(
+        self,
+        other: 'ViewBounds',
+        width: int,
+        height: int
+    ) -> Optional[Tuple[int, int]]:
+        """other への移動が整数ピクセルの平行移動であればその量を返す。
+
+        Args:
+            other: 移動後の表示範囲
+            width: 画像幅 (ピクセル)
+            height: 画像高さ (ピクセル)
+
+        Returns:
+            (dx, dy) ピクセル。ズームを伴う場合や画像外への移動の場合は None
+        """
+        if width < 2 or height < 2:
+            return None
+        if not (np.isclose(other.x_range, self.x_range, rtol=1e-9, atol=0.0)
+                and np.isclose(other.y_range, self.y_range, rtol=1e-9, atol=0.0)):
+            return None
+
+        fx = (other.xmin - self.xmin) / (self.x_range / (width - 1))
+        fy = (other.ymin - self.ymin) / (self.y_range / (height - 1))
+        dx, dy = round(fx), round(fy)
+        if abs(fx - dx) > 1e-6 or abs(fy - dy) > 1e-6:
+            return None
+        if abs(dx) >= width or abs(dy) >= height:
+            return None
+        return dx, dy
+
 
 # =============================================================================
 # MandelbrotViewer クラス
@@ -406,7 +1414,40 @@ class MandelbrotViewer:
 
         # 表示範囲
         self.initial_bounds = ViewBounds.from_tuple(CONFIG.INITIAL_BOUNDS)
-        self.bounds = ViewBounds.from_tuple(CONFIG.INITIAL_BOUNDS)
+        self.bounds = self.initial_bounds
+
+        # 座標軸のキャッシュ (範囲が変わった軸だけ再計算する)
+        self._x_key: Optional[Tuple[int, float, float]] = None
+        self._y_key: Optional[Tuple[int, float, float]] = None
+        self._x_vec: Optional[np.ndarray] = None
+        self._y_vec: Optional[np.ndarray] = None
+
+        # 計算結果の書き込み先 (2枚を交互に使い、フレームごとに確保し直さない)
+        # 前フレームを読みながら次のフレームを書けるので、パン時のコピーも重ならない
+        self._buffers = [
+            np.empty((height, width), dtype=np.int32),
+            np.empty((height, width), dtype=np.int32),
+        ]
+
+        # 計算用スレッド (計算中も GUI のイベント処理を止めない)
+        # プレビューを含め計算はすべてこのスレッドで行う。Numba の parallel=True の
+        # カーネルは、スレッドセーフでない threading layer (workqueue) では
+        # 複数のスレッドから同時に呼ぶとプロセスが異常終了するため
+        self._compute_pool = ThreadPoolExecutor(max_workers=1)
+        self._current_future: Optional[Future] = None
+        self._future_bounds: Optional[ViewBounds] = None
+        self._future_is_preview = False
+        self._poll_timer: Optional[TimerBase] = None
+
+        # 直前に表示したフレーム (パン時に重なる部分を再利用する)
+        self._M_prev: Optional[np.ndarray] = None
+        self._prev_bounds: Optional[ViewBounds] = None
+
+        # 操作直後に表示する低解像度プレビューの書き込み先
+        self._M_preview = np.empty(
+            (max(1, height // CONFIG.PREVIEW_SCALE), max(1, width // CONFIG.PREVIEW_SCALE)),
+            dtype=np.int32
+        )
 
         # 画像保存カウンタ
         self.save_counter = 0
@@ -418,16 +1459,52 @@ class MandelbrotViewer:
         self.cbar: Optional['Colorbar'] = None
         self.status_text: Optional[Text] = None
 
-        # キーハンドラマッピング
-        self._key_handlers: Dict[str, Callable[[], None]] = {
-            'r': self._reset_view,
-            's': self._save_image,
-            'q': self._quit,
-        }
-
+        # ホイール操作で決まったがまだ計算していない表示範囲
+        self._pending_bounds: Optional[ViewBounds] = None
+        self._scroll_timer: Optional[TimerBase] = None
+
+        # 画像に最後に設定した表示範囲 (変わった時だけ設定し直す)
+        self._last_extent: Optional[Tuple[float, float, float, float]] = None
+
+        # 反復回数から RGBA への変換表 (最大反復回数が変わった時だけ作り直す)
+        self._lut: Optional[np.ndarray] = None
+        self._lut_max_iter: Optional[int] = None
+
+        # 画像とステータス以外を描画済みの背景 (部分描画で使う)
+        self._bg: Optional[Any] = None
+        # 保存用の描画中か (savefig も draw_event を発生させるため、その間は背景を取り直さない)
+        self._saving = False
+
+        # PNG の書き出しを行うスレッド (保存中も操作できるようにする)
+        self._save_pool = ThreadPoolExecutor(max_workers=1)
+        # 保存範囲 (bbox_inches='tight' 相当) のキャッシュ。
+        # キーは図のサイズ (インチ) と軸・カラーバーの範囲 (目盛りラベルの幅が変わるため)
+        self._save_bbox: Optional[Bbox] = None
+        self._save_bbox_key: Optional[Tuple[Tuple[float, ...], ...]] = None
+
+        # キーハンドラ表 (1文字の ASCII キーの文字コードで引く)
+        key_table: List[Optional[Callable[[], None]]] = [None] * 128
+        key_table[ord('r')] = self._reset_view
+        key_table[ord('s')] = self._save_image
+        key_table[ord('q')] = self._quit
+        self._key_table: Tuple[Optional[Callable[[], None]], ...] = tuple(key_table)
+
+        self._warm_up()
         self._setup_plot()
         self._update_image()
 
+    def _warm_up(self) -> None:
+        """計算カーネルを小さな画像で一度呼び出しておく。
+
+        JIT コンパイル (Numba・GPU) やキャッシュの読み込みを起動時に済ませ、
+        最初の操作で待たされないようにする。
+        """
+        b = self.initial_bounds
+        mandelbrot_set_vectorized(
+            b.xmin, b.xmax, b.ymin, b.ymax, 2, 2, self._effective_max_iter(),
+            show_progress=False
+        )
+
     def _setup_plot(self) -> None:
         """プロットの初期設定を行う。"""
         self.fig, self.ax = plt.subplots(
@@ -436,13 +1513,15 @@ class MandelbrotViewer:
         )
         self.fig.canvas.manager.set_window_title('マンデルブロ集合ビューア')
 
-        # 初期画像（ダミー）
+        # 初期画像（ダミー）: 色付けは自前の LUT で行うので RGBA で渡す
+        self._last_extent = self.bounds.to_tuple()
+        self._build_lut(self._effective_max_iter())
         self.im = self.ax.imshow(
-            np.zeros((self.height, self.width)),
-            extent=list(self.bounds.to_tuple()),
-            cmap=self.cmap,
+            np.zeros((self.height, self.width, 4), dtype=np.uint8),
+            extent=self._last_extent,
             origin='lower',
-            aspect='equal'
+            aspect='equal',
+            animated=True
         )
 
         self._setup_labels()
@@ -462,7 +1541,10 @@ class MandelbrotViewer:
 
     def _setup_colorbar(self) -> None:
         """カラーバーを設定する。"""
-        self.cbar = plt.colorbar(self.im, ax=self.ax, shrink=0.8)
+        self.cbar = plt.colorbar(
+            ScalarMappable(norm=Normalize(0, self._lut_max_iter), cmap=self.cmap),
+            ax=self.ax, shrink=0.8
+        )
         self.cbar.set_label('反復回数', fontsize=12)
 
     def _setup_status_text(self) -> None:
@@ -471,7 +1553,8 @@ class MandelbrotViewer:
             0.02, 0.02, '',
             fontsize=10,
             transform=self.fig.transFigure,
-            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8)
+            bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.8),
+            animated=True
         )
 
     def _setup_help_text(self) -> None:
@@ -489,28 +1572,315 @@ class MandelbrotViewer:
         self.fig.canvas.mpl_connect('scroll_event', self._on_scroll)
         self.fig.canvas.mpl_connect('button_press_event', self._on_press)
         self.fig.canvas.mpl_connect('key_press_event', self._on_key)
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+        self.fig.canvas.mpl_connect('resize_event', self._on_resize)
+        self.fig.canvas.mpl_connect('close_event', self._on_close)
+
+        # 計算結果の確認用タイマー (Matplotlib の操作はメインスレッドで行う)
+        self._poll_timer = self.fig.canvas.new_timer(interval=CONFIG.RESULT_POLL_MS)
+        self._poll_timer.add_callback(self._poll_result)
+
+        # 連続したホイール操作をまとめ、最後の表示範囲だけを計算するタイマー
+        self._scroll_timer = self.fig.canvas.new_timer(interval=CONFIG.SCROLL_DEBOUNCE_MS)
+        self._scroll_timer.single_shot = True
+        self._scroll_timer.add_callback(self._flush_scroll)
 
     def _update_image(self) -> None:
-        """画像を更新する。"""
+        """画像の再計算を開始する (計算は計算用スレッドで行う)。"""
         self._set_status('計算中...')
-        self.fig.canvas.draw_idle()
-        self.fig.canvas.flush_events()
-
-        # マンデルブロ集合を計算
-        M = mandelbrot_set_vectorized(
-            self.bounds.xmin, self.bounds.xmax,
-            self.bounds.ymin, self.bounds.ymax,
-            self.width, self.height, self.max_iter
-        )
+        self._refresh()
+
+        x, y = self._get_axes()
+
+        # 前フレームとは別のバッファに書く (パン時は前フレームを読みながら書くため)
+        out = self._buffers[1] if self._M_prev is self._buffers[0] else self._buffers[0]
+
+        # 純粋なパンなら前フレームと重なる部分を再利用する
+        shift = self._pan_shift()
+        if shift is not None:
+            job = functools.partial(
+                mandelbrot_set_shifted,
+                self._M_prev, shift, x, y, self._effective_max_iter(),
+                out=out, use_float32=self._use_float32()
+            )
+        else:
+            job = self._make_job(out, self.width, self.height, x=x, y=y)
+        self._submit(job, preview=False)
+
+    def _update_image_progressive(self) -> None:
+        """低解像度のプレビューを先に表示し、本計算はその後で行う。
+
+        ズームなど全体の再計算が必要な操作で、画面が固まる時間を短くする。
+        プレビューも計算用スレッドで計算し、表示した後で本計算を始める。
+        """
+        if self._pan_shift() is not None:
+            # 重なる部分を再利用できるパンは本計算でも十分速い
+            self._update_image()
+            return
+
+        self._set_status('計算中...')
+        self._refresh()
+
+        h, w = self._M_preview.shape
+        self._submit(self._make_job(self._M_preview, w, h, show_progress=False), preview=True)
+
+    def _submit(self, job: Callable[[], np.ndarray], preview: bool) -> None:
+        """計算を計算用スレッドに投入し、完了の確認を始める。
+
+        Args:
+            job: 反復回数の2次元配列を返す計算
+            preview: プレビューの計算か
+        """
+        # まだ始まっていない古いフレームの計算は取り消す
+        # (実行中のものは止められないが、結果は _show_result などで捨てられる)
+        if self._current_future is not None:
+            self._current_future.cancel()
+
+        self._current_future = self._compute_pool.submit(job)
+        self._future_bounds = self.bounds
+        self._future_is_preview = preview
+        self._poll_timer.start()
+
+    def _poll_result(self) -> None:
+        """計算用スレッドの計算が終わっていれば結果を表示する。"""
+        future = self._current_future
+        if future is None:
+            self._poll_timer.stop()
+            return
+        if not future.done():
+            return
+
+        self._current_future = None
+        self._poll_timer.stop()
+        if future.cancelled():
+            return
+        if self._future_is_preview:
+            self._show_preview(future.result(), self._future_bounds)
+        else:
+            self._show_result(future.result(), self._future_bounds)
+
+    def _show_preview(self, M: np.ndarray, bounds: ViewBounds) -> None:
+        """プレビューを表示し、同じ表示範囲の本計算を始める。
+
+        Args:
+            M: 反復回数を格納した2次元配列 (低解像度)
+            bounds: M を計算した表示範囲
+        """
+        # 計算中に表示範囲が変わっていれば、その範囲の計算が別途始まるので捨てる
+        if bounds != self.bounds:
+            return
+
+        layout_changed = self._present(M)
+        self._refresh(full=layout_changed)
+        self._update_image()
+
+    def _show_result(self, M: np.ndarray, bounds: ViewBounds) -> None:
+        """計算結果を表示する。
+
+        Args:
+            M: 反復回数を格納した2次元配列
+            bounds: M を計算した表示範囲
+        """
+        # 計算中に表示範囲が変わっていれば、その範囲の計算が別途始まるので捨てる
+        if bounds != self.bounds:
+            return
 
-        # 画像を更新
-        self.im.set_data(M)
-        self.im.set_extent(list(self.bounds.to_tuple()))
-        self.im.set_clim(0, self.max_iter)
+        self._M_prev = M
+        self._prev_bounds = bounds
 
-        # ステータス更新
+        layout_changed = self._present(M)
         self._update_status_display()
-        self.fig.canvas.draw_idle()
+        self._refresh(full=layout_changed)
+
+    def _pan_shift(self) -> Optional[Tuple[int, int]]:
+        """直前のフレームからの移動が整数ピクセルの平行移動ならその量を返す。
+
+        Returns:
+            (dx, dy) ピクセル。再利用できない場合は None
+        """
+        # 摂動法は画像中央を参照点にするため、前フレームの一部だけを再利用できない
+        if self._prev_bounds is None or self._use_perturbation():
+            return None
+        return self._prev_bounds.pixel_shift(self.bounds, self.width, self.height)
+
+    def _make_job(
+        self,
+        out: np.ndarray,
+        width: int,
+        height: int,
+        show_progress: bool = True,
+        x: Optional[np.ndarray] = None,
+        y: Optional[np.ndarray] = None
+    ) -> Callable[[], np.ndarray]:
+        """現在の表示範囲を指定した解像度で計算する処理を作る。
+
+        表示範囲などの値は呼び出した時点で確定させるので、
+        計算用スレッドで実行する間に表示範囲が変わっても影響しない。
+
+        Args:
+            out: 結果の書き込み先 (height x width, int32)
+            width: 画像幅 (ピクセル)
+            height: 画像高さ (ピクセル)
+            show_progress: プログレスバーを表示するか
+            x: 事前計算済みの実軸 (省略時は生成する)
+            y: 事前計算済みの虚軸 (省略時は生成する)
+
+        Returns:
+            反復回数を格納した2次元配列 (height x width) を返す呼び出し可能オブジェクト
+        """
+        b = self.bounds
+        if self._use_perturbation():
+            return functools.partial(
+                mandelbrot_set_perturbation,
+                b.xmin, b.xmax, b.ymin, b.ymax,
+                width, height, self._effective_max_iter(),
+                show_progress=show_progress, out=out
+            )
+        return functools.partial(
+            mandelbrot_set_vectorized,
+            b.xmin, b.xmax, b.ymin, b.ymax,
+            width, height, self._effective_max_iter(),
+            show_progress=show_progress, use_float32=self._use_float32(),
+            x=x, y=y, out=out
+        )
+
+    def _use_float32(self) -> bool:
+        """現在のズームレベルを float32 で計算できるか判定する。
+
+        float32 は作業配列のメモリ量が半分で済むが、深いズームでは
+        ピクセル間隔に対して精度が足りなくなるため float64 に切り替える。
+
+        Returns:
+            float32 で計算してよければ True
+        """
+        zoom_level = CONFIG.INITIAL_X_RANGE / self.bounds.x_range
+        return zoom_level <= CONFIG.FLOAT32_MAX_ZOOM
+
+    def _use_perturbation(self) -> bool:
+        """現在のズームレベルを摂動法で計算するか判定する。
+
+        Returns:
+            ズームレベルが PERTURBATION_MIN_ZOOM を超えていれば True
+        """
+        zoom_level = CONFIG.INITIAL_X_RANGE / self.bounds.x_range
+        return zoom_level > CONFIG.PERTURBATION_MIN_ZOOM
+
+    def _effective_max_iter(self) -> int:
+        """現在のズームレベルに応じた最大反復回数を返す。
+
+        初期表示では max_iter の ADAPTIVE_ITER_BASE 倍とし、ズームが2倍になるごとに
+        ADAPTIVE_ITER_PER_OCTAVE 倍ずつ増やす (上限は max_iter)。
+        値は max_iter の 1/8 単位に切り上げ、Numba のカーネル特殊化が
+        ズームのたびに増えないようにする。
+
+        Returns:
+            最大反復回数
+        """
+        zoom_level = CONFIG.INITIAL_X_RANGE / self.bounds.x_range
+        ratio = CONFIG.ADAPTIVE_ITER_BASE + CONFIG.ADAPTIVE_ITER_PER_OCTAVE * math.log2(
+            max(zoom_level, 1.0)
+        )
+        step = max(1, self.max_iter // 8)
+        return min(self.max_iter, math.ceil(self.max_iter * ratio / step) * step)
+
+    def _present(self, M: np.ndarray) -> bool:
+        """計算結果を LUT で色付けして画像に反映する (表示サイズへの拡大は imshow に任せる)。
+
+        Args:
+            M: 反復回数を格納した2次元配列
+
+        Returns:
+            表示範囲またはカラーバーの範囲が変わり、図全体の再描画が必要なら True
+        """
+        # 変わっていなければ設定しない (設定すると座標変換や目盛りが再計算される)
+        layout_changed = False
+        max_iter = self._effective_max_iter()
+        if max_iter != self._lut_max_iter:
+            self._build_lut(max_iter)
+            self.cbar.mappable.set_clim(0, max_iter)
+            layout_changed = True
+        self.im.set_data(self._lut[M])
+
+        extent = self.bounds.to_tuple()
+        if extent != self._last_extent:
+            self.im.set_extent(extent)
+            self._last_extent = extent
+            layout_changed = True
+        return layout_changed
+
+    def _build_lut(self, max_iter: int) -> None:
+        """反復回数 0..max_iter を RGBA (uint8) に変換する LUT を作る。
+
+        色付けを LUT の参照1回で済ませ、Matplotlib のカラーマップ処理で
+        フレームごとに確保される float の RGBA 配列を避ける。
+
+        Args:
+            max_iter: 最大反復回数
+        """
+        self._lut = self.cmap(np.arange(max_iter + 1) / max_iter, bytes=True)
+        self._lut_max_iter = max_iter
+
+    def _refresh(self, full: bool = False) -> None:
+        """画面を更新する。
+
+        軸の目盛りやカラーバーが変わらない場合は、保存済みの背景に
+        画像とステータスだけを重ねて転送する (blit)。
+
+        Args:
+            full: 図全体を再描画するか
+        """
+        canvas = self.fig.canvas
+        if full or self._bg is None or not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self._bg)
+        self._draw_animated()
+        canvas.blit(self.fig.bbox)
+
+    def _draw_animated(self) -> None:
+        """背景に含めていない Artist (画像とステータス) を描画する。"""
+        self.ax.draw_artist(self.im)
+        self.fig.draw_artist(self.status_text)
+
+    def _on_draw(self, event: DrawEvent) -> None:
+        """図全体の再描画のたびに背景を保存し直す。
+
+        Args:
+            event: 描画イベント
+        """
+        if self._saving:
+            return
+        self._bg = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_animated()
+
+    def _on_resize(self, event: ResizeEvent) -> None:
+        """ウィンドウサイズが変わったら背景を破棄する (次の再描画で取り直す)。
+
+        Args:
+            event: リサイズイベント
+        """
+        self._bg = None
+
+    def _get_axes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """座標軸ベクトルを取得する。
+
+        範囲が変わっていない軸はキャッシュを再利用する。
+
+        Returns:
+            (実軸, 虚軸) の1次元配列のタプル
+        """
+        b = self.bounds
+        x_key = (self.width, b.xmin, b.xmax)
+        if x_key != self._x_key:
+            self._x_vec = np.linspace(b.xmin, b.xmax, self.width)
+            self._x_key = x_key
+
+        y_key = (self.height, b.ymin, b.ymax)
+        if y_key != self._y_key:
+            self._y_vec = np.linspace(b.ymin, b.ymax, self.height)
+            self._y_key = y_key
+
+        return self._x_vec, self._y_vec
 
     def _set_status(self, text: str) -> None:
         """ステータステキストを設定する。
@@ -526,6 +1896,8 @@ class MandelbrotViewer:
         center_x, center_y = self.bounds.center
         self._set_status(
             f'中心: ({center_x:.6f}, {center_y:.6f}i) | ズーム: ×{zoom_level:.2f}'
+            f' | 反復: {self._effective_max_iter()}'
+            + (' | 摂動法' if self._use_perturbation() else '')
         )
 
     def _on_scroll(self, event: MouseEvent) -> None:
@@ -543,9 +1915,29 @@ class MandelbrotViewer:
             else CONFIG.ZOOM_FACTOR_SCROLL_OUT
         )
 
-        # マウス位置を中心にズーム
-        self.bounds = self.bounds.zoom_to(event.xdata, event.ydata, zoom_factor)
-        self._update_image()
+        # マウス位置を中心にズーム (計算は操作が途切れてから _flush_scroll で行う)
+        base = self._pending_bounds if self._pending_bounds is not None else self.bounds
+        self._pending_bounds = base.zoom_to(event.xdata, event.ydata, zoom_factor)
+        self._scroll_timer.stop()
+        self._scroll_timer.start()
+
+    def _flush_scroll(self) -> None:
+        """まとめたホイール操作の結果を計算して表示する。"""
+        if self._apply_pending_scroll():
+            self._update_image_progressive()
+
+    def _apply_pending_scroll(self) -> bool:
+        """未計算のホイール操作があれば表示範囲に反映する。
+
+        Returns:
+            反映した場合 True
+        """
+        self._scroll_timer.stop()
+        if self._pending_bounds is None:
+            return False
+        self.bounds = self._pending_bounds
+        self._pending_bounds = None
+        return True
 
     def _on_press(self, event: MouseEvent) -> None:
         """マウスボタン押下を処理する。
@@ -556,10 +1948,16 @@ class MandelbrotViewer:
         if event.inaxes != self.ax or event.xdata is None or event.ydata is None:
             return
 
+        # 直前のホイール操作を反映してからクリック操作を適用する
+        scrolled = self._apply_pending_scroll()
+
         new_bounds = None
         if event.button == MouseButton.LEFT:
             # 左クリック: クリック位置を中心に移動
-            new_bounds = self.bounds.pan_to(event.xdata, event.ydata)
+            # (移動量をピクセル単位に揃え、前フレームを再利用できるようにする)
+            new_bounds = self.bounds.pan_to(*self.bounds.snap_to_pixel(
+                event.xdata, event.ydata, self.width, self.height
+            ))
         elif event.button == MouseButton.RIGHT:
             # 右クリック: ズームイン
             new_bounds = self.bounds.zoom_to(
@@ -569,7 +1967,10 @@ class MandelbrotViewer:
 
         if new_bounds is not None:
             self.bounds = new_bounds
-            self._update_image()
+            self._update_image_progressive()
+        elif scrolled:
+            # 他のボタンでも、反映したホイール操作の結果は描画する
+            self._update_image_progressive()
 
     def _on_key(self, event: KeyEvent) -> None:
         """キー入力を処理する。
@@ -577,24 +1978,101 @@ class MandelbrotViewer:
         Args:
             event: キーイベント
         """
-        handler = self._key_handlers.get(event.key)
-        if handler:
-            handler()
+        key = event.key
+        if key and len(key) == 1 and ord(key) < 128:
+            handler = self._key_table[ord(key)]
+            if handler:
+                handler()
 
     def _reset_view(self) -> None:
         """表示を初期状態にリセットする。"""
-        self.bounds = copy.copy(self.initial_bounds)
+        self._scroll_timer.stop()
+        self._pending_bounds = None
+        self.bounds = self.initial_bounds
         self._update_image()
 
     def _save_image(self) -> None:
-        """現在の表示を画像として保存する。"""
+        """現在の表示を画像として保存する。
+
+        描画は GUI スレッドで行い、PNG のエンコードと書き込みは
+        別スレッドに任せる (保存中も操作を受け付ける)。
+        """
         self.save_counter += 1
         filename = f'mandelbrot_{self.save_counter:03d}.png'
-        self.fig.savefig(filename, dpi=CONFIG.SAVE_DPI, bbox_inches='tight')
+        # 部分描画用に animated にした Artist も保存画像には含める
+        artists = (self.im, self.status_text)
+        for artist in artists:
+            artist.set_animated(False)
+        self._saving = True
+        try:
+            rgba = self._render_for_save()
+        finally:
+            self._saving = False
+            for artist in artists:
+                artist.set_animated(True)
+        self._save_pool.submit(self._write_png, rgba, filename)
+
+    def _render_for_save(self) -> np.ndarray:
+        """図を保存用の解像度で RGBA 配列に描画する。
+
+        Returns:
+            RGBA 画像 (高さ x 幅 x 4, uint8)
+        """
+        bbox = self._get_save_bbox()
+        buf = io.BytesIO()
+        self.fig.savefig(buf, format='rgba', dpi=CONFIG.SAVE_DPI, bbox_inches=bbox)
+        height = int(bbox.height * CONFIG.SAVE_DPI)
+        return np.frombuffer(buf.getbuffer(), dtype=np.uint8).reshape(height, -1, 4)
+
+    def _get_save_bbox(self) -> Bbox:
+        """保存範囲 (bbox_inches='tight' 相当) を返す。
+
+        余白の計算には図全体の描画が1回必要になるため、
+        図のサイズと目盛りラベルを決める範囲 (x/y 軸とカラーバー) が
+        変わらない限り、前回求めた範囲を使い回す。
+
+        Returns:
+            保存範囲 (インチ)
+        """
+        key = (
+            tuple(self.fig.get_size_inches()),
+            tuple(self.ax.get_xlim()),
+            tuple(self.ax.get_ylim()),
+            tuple(self.cbar.mappable.get_clim()),
+        )
+        if key != self._save_bbox_key:
+            renderer = self.fig.canvas.get_renderer()
+            self._save_bbox = self.fig.get_tightbbox(renderer).padded(
+                mpl.rcParams['savefig.pad_inches']
+            )
+            self._save_bbox_key = key
+        return self._save_bbox
+
+    @staticmethod
+    def _write_png(rgba: np.ndarray, filename: str) -> None:
+        """RGBA 配列を PNG ファイルに書き出す (保存用スレッドで実行する)。
+
+        Args:
+            rgba: RGBA 画像 (高さ x 幅 x 4, uint8)
+            filename: 保存先のファイル名
+        """
+        Image.fromarray(rgba, 'RGBA').save(filename, optimize=False)
         print(f"画像を保存しました: {filename}")
 
+    def _on_close(self, event: CloseEvent) -> None:
+        """ウィンドウを閉じたら計算を止める。
+
+        Args:
+            event: クローズイベント
+        """
+        self._poll_timer.stop()
+        self._scroll_timer.stop()
+        self._compute_pool.shutdown(wait=False, cancel_futures=True)
+
     def _quit(self) -> None:
         """ビューアを終了する。"""
+        # 書き出し中の画像があれば完了を待つ
+        self._save_pool.shutdown(wait=True)
         plt.close(self.fig)
 
     def show(self) -> None:
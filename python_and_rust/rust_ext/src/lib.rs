@@ -7,6 +7,21 @@ use numpy::{IntoPyArray, PyArray2};
 use pyo3::prelude::*;
 use rayon::prelude::*;
 
+mod simd;
+
+/// 主カージオイドまたは周期2のバルブに含まれるか判定する
+///
+/// これらの点は発散しないため、反復計算を省略できる
+#[inline]
+fn in_main_bulbs(cx: f64, cy: f64) -> bool {
+    let cy2 = cy * cy;
+    let q = (cx - 0.25) * (cx - 0.25) + cy2;
+    if q * (q + (cx - 0.25)) <= 0.25 * cy2 {
+        return true;
+    }
+    (cx + 1.0) * (cx + 1.0) + cy2 <= 0.0625
+}
+
 /// 1点のマンデルブロ計算
 ///
 /// # Arguments
@@ -17,7 +32,11 @@ use rayon::prelude::*;
 /// # Returns
 /// 発散するまでの反復回数
 #[inline]
-fn mandelbrot_point(cx: f64, cy: f64, max_iter: u32) -> f64 {
+fn mandelbrot_point(cx: f64, cy: f64, max_iter: u32) -> i32 {
+    if in_main_bulbs(cx, cy) {
+        return max_iter as i32;
+    }
+
     let mut zx = 0.0;
     let mut zy = 0.0;
 
@@ -26,19 +45,20 @@ fn mandelbrot_point(cx: f64, cy: f64, max_iter: u32) -> f64 {
         let zy2 = zy * zy;
 
         if zx2 + zy2 > 4.0 {
-            return i as f64;
+            return i as i32;
         }
 
         zy = 2.0 * zx * zy + cy;
         zx = zx2 - zy2 + cx;
     }
 
-    max_iter as f64
+    max_iter as i32
 }
 
 /// マンデルブロ集合をベクトル化して高速に計算する
 ///
-/// rayonによる並列計算で高速化
+/// rayonによる並列計算と、SIMD による複数ピクセル同時計算で高速化
+/// 座標は np.linspace と同じ刻みで生成する
 ///
 /// # Arguments
 /// * `xmin` - x軸の最小値
@@ -50,7 +70,7 @@ fn mandelbrot_point(cx: f64, cy: f64, max_iter: u32) -> f64 {
 /// * `max_iter` - 最大反復回数
 ///
 /// # Returns
-/// 反復回数を格納した2次元配列 (height x width)
+/// 反復回数を格納した2次元配列 (height x width, int32)
 #[pyfunction]
 fn mandelbrot_set_vectorized(
     py: Python<'_>,
@@ -61,25 +81,26 @@ fn mandelbrot_set_vectorized(
     width: usize,
     height: usize,
     max_iter: u32,
-) -> Py<PyArray2<f64>> {
-    // 結果配列を作成
-    let mut result = vec![0.0f64; width * height];
+) -> Py<PyArray2<i32>> {
+    // 計算中は GIL を解放する (Python 側の別スレッドから呼ばれても GUI を止めない)
+    let result = py.allow_threads(|| {
+        // 結果配列を作成 (反復回数は int32 で持ち、f64 の半分のメモリで済ませる)
+        let mut result = vec![0i32; width * height];
 
-    // x, y の刻み幅
-    let x_step = (xmax - xmin) / (width as f64);
-    let y_step = (ymax - ymin) / (height as f64);
+        // x, y の刻み幅 (np.linspace と同じく両端を含む。パン時の再利用はこの刻みが前提)
+        let x_step = if width > 1 { (xmax - xmin) / ((width - 1) as f64) } else { 0.0 };
+        let y_step = if height > 1 { (ymax - ymin) / ((height - 1) as f64) } else { 0.0 };
 
-    // 並列計算 (行単位で並列化)
-    result
-        .par_chunks_mut(width)
-        .enumerate()
-        .for_each(|(row, row_data)| {
-            let cy = ymin + (row as f64) * y_step;
-            for (col, pixel) in row_data.iter_mut().enumerate() {
-                let cx = xmin + (col as f64) * x_step;
-                *pixel = mandelbrot_point(cx, cy, max_iter);
-            }
-        });
+        // 並列計算 (行単位で並列化)
+        result
+            .par_chunks_mut(width)
+            .enumerate()
+            .for_each(|(row, row_data)| {
+                let cy = ymin + (row as f64) * y_step;
+                simd::fill_row(row_data, xmin, x_step, cy, max_iter);
+            });
+        result
+    });
 
     // NumPy配列に変換して返す
     let array = Array2::from_shape_vec((height, width), result).unwrap();
@@ -0,0 +1,268 @@
+//! SIMD による複数ピクセル同時計算
+//!
+//! 1行のうち連続するピクセルを1本のベクトルとしてまとめて反復し、
+//! 全レーンが発散した時点でループを抜ける。
+//! x86_64 では AVX-512 (8 ピクセル) または AVX2 (4 ピクセル) を実行時に検出して使い、
+//! aarch64 では NEON を使用する。どれも使えない場合はスカラー版で計算する。
+//! 結果がスカラー版と一致するよう、丸めが変わる FMA は使わない
+//! (2*zr*zi + ci は 2 倍が誤差なしなので FMA でも同じ丸めになる)。
+
+use crate::mandelbrot_point;
+
+/// AVX2・NEON・スカラー版で1回にまとめて計算するピクセル数
+pub const LANES: usize = 4;
+
+/// AVX-512 版で1回にまとめて計算するピクセル数
+#[cfg(target_arch = "x86_64")]
+pub const LANES_AVX512: usize = 8;
+
+/// スカラー版 (SIMD 非対応 CPU 用)
+unsafe fn lanes_scalar(cx: &[f64; LANES], cy: f64, max_iter: u32) -> [f64; LANES] {
+    cx.map(|x| mandelbrot_point(x, cy, max_iter) as f64)
+}
+
+/// AVX-512 版 (__m512d に 8 ピクセル)
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx512f")]
+unsafe fn lanes_avx512(
+    cx: &[f64; LANES_AVX512],
+    cy: f64,
+    max_iter: u32,
+) -> [f64; LANES_AVX512] {
+    use std::arch::x86_64::*;
+
+    let cr = _mm512_loadu_pd(cx.as_ptr());
+    let ci = _mm512_set1_pd(cy);
+    let four = _mm512_set1_pd(4.0);
+    let two = _mm512_set1_pd(2.0);
+    let one = _mm512_set1_pd(1.0);
+    let quarter = _mm512_set1_pd(0.25);
+
+    // 主カージオイド/周期2のバルブ内のレーン (in_main_bulbs と同じ式)
+    let ci2 = _mm512_mul_pd(ci, ci);
+    let xq = _mm512_sub_pd(cr, quarter);
+    let q = _mm512_add_pd(_mm512_mul_pd(xq, xq), ci2);
+    let in_cardioid = _mm512_cmp_pd_mask::<_CMP_LE_OQ>(
+        _mm512_mul_pd(q, _mm512_add_pd(q, xq)),
+        _mm512_mul_pd(quarter, ci2),
+    );
+    let xp = _mm512_add_pd(cr, one);
+    let in_bulb = _mm512_cmp_pd_mask::<_CMP_LE_OQ>(
+        _mm512_add_pd(_mm512_mul_pd(xp, xp), ci2),
+        _mm512_set1_pd(0.0625),
+    );
+    let interior = in_cardioid | in_bulb;
+
+    // 内部のレーンは反復回数を max_iter から始め、最初から計算対象外にする
+    let mut active: __mmask8 = !interior;
+    let mut n = _mm512_maskz_mov_pd(interior, _mm512_set1_pd(max_iter as f64));
+
+    let mut zr = _mm512_setzero_pd();
+    let mut zi = _mm512_setzero_pd();
+
+    for _ in 0..max_iter {
+        let zr2 = _mm512_mul_pd(zr, zr);
+        let zi2 = _mm512_mul_pd(zi, zi);
+        let mag = _mm512_add_pd(zr2, zi2);
+
+        // 比較結果はマスクレジスタに入る。一度発散したレーンは二度と計算対象に戻さない
+        active = _mm512_mask_cmp_pd_mask::<_CMP_LE_OQ>(active, mag, four);
+        if active == 0 {
+            break;
+        }
+        n = _mm512_mask_add_pd(n, active, n, one);
+
+        // zi = 2*zr*zi + ci, zr = zr2 - zi2 + cr (発散していないレーンだけ更新)
+        let zi_new = _mm512_fmadd_pd(_mm512_mul_pd(zr, zi), two, ci);
+        let zr_new = _mm512_add_pd(_mm512_sub_pd(zr2, zi2), cr);
+        zi = _mm512_mask_mov_pd(zi, active, zi_new);
+        zr = _mm512_mask_mov_pd(zr, active, zr_new);
+    }
+
+    let mut out = [0.0; LANES_AVX512];
+    _mm512_storeu_pd(out.as_mut_ptr(), n);
+    out
+}
+
+/// AVX2 版 (__m256d に 4 ピクセル)
+#[cfg(target_arch = "x86_64")]
+#[target_feature(enable = "avx2")]
+unsafe fn lanes_avx2(cx: &[f64; LANES], cy: f64, max_iter: u32) -> [f64; LANES] {
+    use std::arch::x86_64::*;
+
+    let cr = _mm256_loadu_pd(cx.as_ptr());
+    let ci = _mm256_set1_pd(cy);
+    let four = _mm256_set1_pd(4.0);
+    let two = _mm256_set1_pd(2.0);
+    let one = _mm256_set1_pd(1.0);
+    let quarter = _mm256_set1_pd(0.25);
+
+    // 主カージオイド/周期2のバルブ内のレーン (in_main_bulbs と同じ式)
+    let ci2 = _mm256_mul_pd(ci, ci);
+    let xq = _mm256_sub_pd(cr, quarter);
+    let q = _mm256_add_pd(_mm256_mul_pd(xq, xq), ci2);
+    let in_cardioid = _mm256_cmp_pd::<_CMP_LE_OQ>(
+        _mm256_mul_pd(q, _mm256_add_pd(q, xq)),
+        _mm256_mul_pd(quarter, ci2),
+    );
+    let xp = _mm256_add_pd(cr, one);
+    let in_bulb = _mm256_cmp_pd::<_CMP_LE_OQ>(
+        _mm256_add_pd(_mm256_mul_pd(xp, xp), ci2),
+        _mm256_set1_pd(0.0625),
+    );
+    let interior = _mm256_or_pd(in_cardioid, in_bulb);
+
+    // 内部のレーンは反復回数を max_iter から始め、最初から計算対象外にする
+    let all = _mm256_castsi256_pd(_mm256_set1_epi64x(-1));
+    let mut active = _mm256_andnot_pd(interior, all);
+    let mut n = _mm256_and_pd(interior, _mm256_set1_pd(max_iter as f64));
+
+    let mut zr = _mm256_setzero_pd();
+    let mut zi = _mm256_setzero_pd();
+
+    for _ in 0..max_iter {
+        let zr2 = _mm256_mul_pd(zr, zr);
+        let zi2 = _mm256_mul_pd(zi, zi);
+        let mag = _mm256_add_pd(zr2, zi2);
+
+        // 一度発散したレーンは二度と計算対象に戻さない
+        active = _mm256_and_pd(active, _mm256_cmp_pd::<_CMP_LE_OQ>(mag, four));
+        if _mm256_movemask_pd(active) == 0 {
+            break;
+        }
+        n = _mm256_add_pd(n, _mm256_and_pd(active, one));
+
+        // zi = 2*zr*zi + ci, zr = zr2 - zi2 + cr
+        let zi_new = _mm256_add_pd(_mm256_mul_pd(_mm256_mul_pd(two, zr), zi), ci);
+        let zr_new = _mm256_add_pd(_mm256_sub_pd(zr2, zi2), cr);
+        zi = _mm256_blendv_pd(zi, zi_new, active);
+        zr = _mm256_blendv_pd(zr, zr_new, active);
+    }
+
+    let mut out = [0.0; LANES];
+    _mm256_storeu_pd(out.as_mut_ptr(), n);
+    out
+}
+
+/// NEON 版 (float64x2_t 2本に 4 ピクセル)
+#[cfg(target_arch = "aarch64")]
+unsafe fn lanes_neon(cx: &[f64; LANES], cy: f64, max_iter: u32) -> [f64; LANES] {
+    use std::arch::aarch64::*;
+
+    let cr = [vld1q_f64(cx.as_ptr()), vld1q_f64(cx.as_ptr().add(2))];
+    let ci = vdupq_n_f64(cy);
+    let four = vdupq_n_f64(4.0);
+    let two = vdupq_n_f64(2.0);
+    let one = vreinterpretq_u64_f64(vdupq_n_f64(1.0));
+    let quarter = vdupq_n_f64(0.25);
+    let limit = vreinterpretq_u64_f64(vdupq_n_f64(max_iter as f64));
+
+    let mut active = [vdupq_n_u64(0); 2];
+    let mut n = [vdupq_n_f64(0.0); 2];
+    for k in 0..2 {
+        // 主カージオイド/周期2のバルブ内のレーン (in_main_bulbs と同じ式)
+        let ci2 = vmulq_f64(ci, ci);
+        let xq = vsubq_f64(cr[k], quarter);
+        let q = vaddq_f64(vmulq_f64(xq, xq), ci2);
+        let in_cardioid = vcleq_f64(vmulq_f64(q, vaddq_f64(q, xq)), vmulq_f64(quarter, ci2));
+        let xp = vaddq_f64(cr[k], vdupq_n_f64(1.0));
+        let in_bulb = vcleq_f64(vaddq_f64(vmulq_f64(xp, xp), ci2), vdupq_n_f64(0.0625));
+        let interior = vorrq_u64(in_cardioid, in_bulb);
+
+        // 内部のレーンは反復回数を max_iter から始め、最初から計算対象外にする
+        active[k] = veorq_u64(interior, vdupq_n_u64(u64::MAX));
+        n[k] = vreinterpretq_f64_u64(vandq_u64(interior, limit));
+    }
+
+    let mut zr = [vdupq_n_f64(0.0); 2];
+    let mut zi = [vdupq_n_f64(0.0); 2];
+
+    for _ in 0..max_iter {
+        let mut any_active = 0u32;
+        for k in 0..2 {
+            let zr2 = vmulq_f64(zr[k], zr[k]);
+            let zi2 = vmulq_f64(zi[k], zi[k]);
+            let mag = vaddq_f64(zr2, zi2);
+
+            // 一度発散したレーンは二度と計算対象に戻さない
+            active[k] = vandq_u64(active[k], vcleq_f64(mag, four));
+            any_active |= vmaxvq_u32(vreinterpretq_u32_u64(active[k]));
+            n[k] = vaddq_f64(n[k], vreinterpretq_f64_u64(vandq_u64(active[k], one)));
+
+            // zi = 2*zr*zi + ci, zr = zr2 - zi2 + cr
+            let zi_new = vaddq_f64(vmulq_f64(vmulq_f64(two, zr[k]), zi[k]), ci);
+            let zr_new = vaddq_f64(vsubq_f64(zr2, zi2), cr[k]);
+            zi[k] = vbslq_f64(active[k], zi_new, zi[k]);
+            zr[k] = vbslq_f64(active[k], zr_new, zr[k]);
+        }
+        if any_active == 0 {
+            break;
+        }
+    }
+
+    let mut out = [0.0; LANES];
+    vst1q_f64(out.as_mut_ptr(), n[0]);
+    vst1q_f64(out.as_mut_ptr().add(2), n[1]);
+    out
+}
+
+/// `N` ピクセルずつ `lanes_fn` で計算し、端数はスカラーで計算する
+///
+/// ベクトル内の反復回数は f64 で数え、書き込み時に i32 に変換する (整数なので誤差はない)。
+///
+/// # Safety
+/// `lanes_fn` は実行中の CPU がサポートする命令セットの実装であること
+unsafe fn fill_row_with<const N: usize>(
+    row_data: &mut [i32],
+    xmin: f64,
+    x_step: f64,
+    cy: f64,
+    max_iter: u32,
+    lanes_fn: unsafe fn(&[f64; N], f64, u32) -> [f64; N],
+) {
+    let mut chunks = row_data.chunks_exact_mut(N);
+    let mut col = 0;
+    for chunk in &mut chunks {
+        let cx: [f64; N] = std::array::from_fn(|k| xmin + ((col + k) as f64) * x_step);
+        for (pixel, n) in chunk.iter_mut().zip(lanes_fn(&cx, cy, max_iter)) {
+            *pixel = n as i32;
+        }
+        col += N;
+    }
+
+    for (k, pixel) in chunks.into_remainder().iter_mut().enumerate() {
+        let cx = xmin + ((col + k) as f64) * x_step;
+        *pixel = mandelbrot_point(cx, cy, max_iter);
+    }
+}
+
+/// 1行分のマンデルブロ計算
+///
+/// 実行中の CPU で使える最速の命令セットを選んで計算する。
+///
+/// # Arguments
+/// * `row_data` - 結果の書き込み先 (1行分)
+/// * `xmin` - 行の先頭ピクセルの実部
+/// * `x_step` - x の刻み幅
+/// * `cy` - 行の虚部
+/// * `max_iter` - 最大反復回数
+pub fn fill_row(row_data: &mut [i32], xmin: f64, x_step: f64, cy: f64, max_iter: u32) {
+    // SAFETY: 各命令セットの実装は、実行時に CPU の対応を確認してから使う
+    unsafe {
+        #[cfg(target_arch = "x86_64")]
+        {
+            if is_x86_feature_detected!("avx512f") {
+                return fill_row_with(row_data, xmin, x_step, cy, max_iter, lanes_avx512);
+            }
+            if is_x86_feature_detected!("avx2") {
+                return fill_row_with(row_data, xmin, x_step, cy, max_iter, lanes_avx2);
+            }
+        }
+        #[cfg(target_arch = "aarch64")]
+        {
+            return fill_row_with(row_data, xmin, x_step, cy, max_iter, lanes_neon);
+        }
+        #[allow(unreachable_code)]
+        fill_row_with(row_data, xmin, x_step, cy, max_iter, lanes_scalar)
+    }
+}
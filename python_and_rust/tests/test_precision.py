@@ -0,0 +1,90 @@
+"""計算精度 (float32 / float64) の切り替えのテスト。"""
+
+import importlib.util
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+
+_MODULE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'mandelbrot.py'
+)
+
+
+def _load_module():
+    """python_and_rust/mandelbrot.py を読み込む (python/ の同名モジュールと区別する)。"""
+    spec = importlib.util.spec_from_file_location('mandelbrot_python_and_rust', _MODULE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+mb = _load_module()
+
+
+class MlxPrecisionTest(unittest.TestCase):
+    """float32 でしか計算できない MLX版の扱いを確認する。"""
+
+    BOUNDS = (-0.76, -0.73, 0.09, 0.11)
+    WIDTH = 40
+    HEIGHT = 30
+    MAX_ITER = 64
+
+    def setUp(self):
+        # MLX の計算カーネルの代わりに、呼ばれたことが分かる値を返すスタブを使う
+        self.stub = mock.Mock(
+            return_value=np.full((self.HEIGHT, self.WIDTH), -1, dtype=np.int32)
+        )
+        patcher = mock.patch.multiple(
+            mb, _USE_GPU=True, _GPU_BACKEND='mlx', _mandelbrot_gpu=self.stub
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _compute(self, use_float32):
+        return mb.mandelbrot_set_vectorized(
+            *self.BOUNDS, self.WIDTH, self.HEIGHT, self.MAX_ITER,
+            show_progress=False, use_float32=use_float32
+        )
+
+    def test_float32_uses_mlx(self):
+        M = self._compute(use_float32=True)
+        self.stub.assert_called_once()
+        self.assertTrue((M == -1).all())
+
+    def test_float64_skips_mlx(self):
+        M = self._compute(use_float32=False)
+        self.stub.assert_not_called()
+
+        with mock.patch.multiple(mb, _USE_GPU=False, _GPU_BACKEND=None):
+            expected = self._compute(use_float32=False)
+        np.testing.assert_array_equal(M, expected)
+
+    def test_shifted_float64_skips_mlx(self):
+        x = np.linspace(self.BOUNDS[0], self.BOUNDS[1], self.WIDTH)
+        y = np.linspace(self.BOUNDS[2], self.BOUNDS[3], self.HEIGHT)
+        prev_M = np.zeros((self.HEIGHT, self.WIDTH), dtype=np.int32)
+        mb.mandelbrot_set_shifted(
+            prev_M, (3, -2), x, y, self.MAX_ITER, use_float32=False
+        )
+        self.stub.assert_not_called()
+
+
+class ViewerPrecisionTest(unittest.TestCase):
+    """ズームレベルによる精度の切り替えを確認する。"""
+
+    def _use_float32(self, zoom_level):
+        viewer = mock.Mock()
+        x_range = mb.CONFIG.INITIAL_X_RANGE / zoom_level
+        viewer.bounds = mb.ViewBounds(-0.75, -0.75 + x_range, 0.0, x_range * 0.75)
+        return mb.MandelbrotViewer._use_float32(viewer)
+
+    def test_switches_to_float64_past_limit(self):
+        self.assertTrue(self._use_float32(1.0))
+        self.assertTrue(self._use_float32(mb.CONFIG.FLOAT32_MAX_ZOOM))
+        self.assertFalse(self._use_float32(mb.CONFIG.FLOAT32_MAX_ZOOM * 2))
+
+
+if __name__ == '__main__':
+    unittest.main()